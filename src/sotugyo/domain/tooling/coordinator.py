@@ -23,7 +23,7 @@ class ToolEnvironmentSnapshot:
     environments: Dict[str, ToolEnvironmentDefinition]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeCatalogRecord:
     """コンテンツブラウザ向けノードカタログ要素。"""
 
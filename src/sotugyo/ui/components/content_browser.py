@@ -14,7 +14,9 @@ from ...infrastructure.settings import SettingsStore, create_settings_store
 Qt = QtCore.Qt
 Signal = QtCore.Signal
 QFileInfo = QtCore.QFileInfo
+QSignalBlocker = QtCore.QSignalBlocker
 QSize = QtCore.QSize
+QTimer = QtCore.QTimer
 QColor = QtGui.QColor
 QFont = QtGui.QFont
 QFontMetrics = QtGui.QFontMetrics
@@ -47,8 +49,24 @@ QWidget = QtWidgets.QWidget
 
 NODE_TYPE_MIME_TYPE = "application/x-sotugyo-node-type"
 
+# ジャンルごとのアイコン塗り色。呼び出しのたびに辞書を組み立てないよう共有する。
+_GENRE_COLORS: Dict[str, QColor] = {
+    "ツール環境": QColor(14, 165, 233),
+    "ワークフロー": QColor(34, 197, 94),
+    "メモ": QColor(249, 115, 22),
+}
+_DEFAULT_GENRE_COLOR = QColor(99, 102, 241)
 
-@dataclass(frozen=True)
+# ノード種別の接頭辞から推定するジャンルの対応表（先頭から順に判定する）。
+# 接頭辞はジャンル単位でタプルにまとめ、startswith 1 回で判定できるようにする。
+_GENRE_PREFIXES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("tool-environment:", "sotugyo.tooling"), "ツール環境"),
+    (("sotugyo.demo.",), "ワークフロー"),
+    (("sotugyo.memo.", "sotugyo.date."), "メモ"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class NodeCatalogEntry:
     """ノード追加候補を表現するエントリ。"""
 
@@ -58,10 +76,25 @@ class NodeCatalogEntry:
     genre: str
     keywords: Tuple[str, ...] = ()
     icon_path: Optional[str] = None
+    display_text: str = field(init=False, repr=False, compare=False)
+    _searchable: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 表示用・検索用の文字列は不変なので生成時に一度だけ組み立てておく。
+        title = self.title.strip()
+        subtitle = self.subtitle.strip()
+        if title and subtitle:
+            text = f"{title}\n{subtitle}"
+        else:
+            text = title or subtitle or self.node_type.strip()
+        object.__setattr__(self, "display_text", text)
+        parts = (self.title, self.subtitle, self.node_type, *self.keywords)
+        object.__setattr__(
+            self, "_searchable", "\n".join(part.lower() for part in parts if part)
+        )
 
     def searchable_text(self) -> str:
-        parts = [self.title, self.subtitle, self.node_type, *self.keywords]
-        return "\n".join(part.lower() for part in parts if part)
+        return self._searchable
 
 
 @dataclass
@@ -211,7 +244,8 @@ class NodeContentBrowser(QWidget):
         self._up_folder_button: Optional[QPushButton] = None
         self._new_folder_button: Optional[QPushButton] = None
         self._icon_cache: Dict[Tuple[str, str, int], QIcon] = {}
-        self._file_icon_provider: QFileIconProvider = QFileIconProvider()
+        # 画像パス付きのエントリが無ければ使わないため、初回利用時に生成する。
+        self._file_icon_provider: Optional[QFileIconProvider] = None
         self._folder_icon: QIcon = self.style().standardIcon(QStyle.SP_DirIcon)
         self._settings_store: SettingsStore = create_settings_store(
             "Sotugyo", "ContentBrowser"
@@ -220,12 +254,36 @@ class NodeContentBrowser(QWidget):
         self._root_folder: CatalogFolder = CatalogFolder("root", None)
         self._current_folder: CatalogFolder = self._root_folder
         self._search_keyword: str = ""
+        # 直前に表示した項目。検索語を絞り込む方向の入力では、ここから再抽出する。
+        self._last_display_items: List[CatalogItem] = []
+        self._last_display_folder: Optional[CatalogFolder] = None
+        self._last_display_keyword: str = ""
+        # フォルダ配下の全エントリの検索用文字列を平坦な列で保持し、再帰走査を避ける。
+        self._folder_search_texts: Dict[int, Tuple[CatalogFolder, Tuple[str, ...]]] = {}
+        self._grid_size_cache: Dict[Tuple[int, str], QSize] = {}
         self._clipboard_items: List[CatalogItem] = []
+        self._catalog_entries: Optional[Tuple[NodeCatalogEntry, ...]] = None
+        # フォルダ構成の変更回数と、最後にカタログ同期した時点の値。
+        self._layout_revision: int = 0
+        self._synced_layout_revision: int = -1
         self._total_entry_count: int = 0
         self._visible_entry_count: int = 0
         self._protected_folder_names: Tuple[str, ...] = ("ワークフロー", "環境定義")
         self._last_node_request_type: Optional[str] = None
         self._last_node_request_time: float = 0.0
+        # ドラッグ中のリサイズは連続して届くため、最後のサイズでまとめて再配置する。
+        self._pending_resize_size: Optional[QSize] = None
+        self._header_vertical: Optional[bool] = None
+        self._applied_icon_size: Optional[int] = None
+        self._resize_timer: QTimer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(150)
+        self._resize_timer.timeout.connect(self._flush_pending_resize)
+        # スライダーのドラッグ中は値が連続で届くため、再配置を短い間隔で間引く。
+        self._icon_size_timer: QTimer = QTimer(self)
+        self._icon_size_timer.setSingleShot(True)
+        self._icon_size_timer.setInterval(50)
+        self._icon_size_timer.timeout.connect(self._apply_icon_size)
 
         self._load_layout()
         self._setup_ui()
@@ -236,16 +294,38 @@ class NodeContentBrowser(QWidget):
         """ウィジェットのリサイズイベントを処理する。"""
 
         super().resizeEvent(event)
-        if event is not None:
+        if event is None:
+            return
+        if not event.oldSize().isValid():
+            # 初回表示時は描画前に配置を確定させる。
             self._update_layout_for_size(event.size())
+            return
+        self._pending_resize_size = event.size()
+        self._resize_timer.start()
+
+    def _flush_pending_resize(self) -> None:
+        size = self._pending_resize_size
+        self._pending_resize_size = None
+        if size is not None:
+            self._update_layout_for_size(size)
 
     # ------------------------------------------------------------------
     # カタログ操作
     # ------------------------------------------------------------------
     def set_catalog_entries(self, entries: Iterable[NodeCatalogEntry]) -> None:
-        catalog_entries = list(entries)
+        catalog_entries = tuple(entries)
+        # カタログもフォルダ構成も前回の同期から変わっていなければ、
+        # 同期結果も表示も変わらないため再構築を省く。
+        # 削除などでフォルダ側が変わっていれば、従来どおり同期で復元する。
+        if (
+            catalog_entries == self._catalog_entries
+            and self._layout_revision == self._synced_layout_revision
+        ):
+            return
+        self._catalog_entries = catalog_entries
         self._total_entry_count = len(catalog_entries)
         self._sync_catalog_entries(catalog_entries)
+        self._synced_layout_revision = self._layout_revision
         self._refresh_view()
 
     def set_available_nodes(self, entries: Iterable[Dict[str, str]]) -> None:
@@ -374,7 +454,7 @@ class NodeContentBrowser(QWidget):
         widget.setWrapping(True)
         widget.setResizeMode(QListView.Adjust)
         widget.setMovement(QListView.Snap)
-        widget.setUniformItemSizes(False)
+        widget.setUniformItemSizes(True)
         widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         widget.setSelectionBehavior(QAbstractItemView.SelectItems)
         widget.setDragDropMode(QAbstractItemView.InternalMove)
@@ -442,6 +522,7 @@ class NodeContentBrowser(QWidget):
         self._available_view.customContextMenuRequested.connect(self._open_context_menu)
         self._available_model.rowsMoved.connect(self._on_rows_moved)
         self._icon_size_slider.valueChanged.connect(self._on_icon_size_changed)
+        self._icon_size_slider.sliderReleased.connect(self._flush_pending_icon_size)
         self._icon_size_spin.valueChanged[int].connect(self._on_icon_size_changed)
         if self._up_folder_button is not None:
             self._up_folder_button.clicked.connect(self._move_to_parent_folder)
@@ -449,8 +530,16 @@ class NodeContentBrowser(QWidget):
             self._new_folder_button.clicked.connect(self._create_new_folder)
 
     def _apply_filter(self) -> None:
-        self._search_keyword = self._search_line.text().strip().lower()
-        self._refresh_view()
+        keyword = self._search_line.text().strip().lower()
+        self._search_keyword = keyword
+        candidates: Optional[List[CatalogItem]] = None
+        if (
+            self._last_display_folder is self._current_folder
+            and self._last_display_keyword in keyword
+        ):
+            # 新しい検索語が直前の語を含むなら、結果は直前の表示の部分集合になる。
+            candidates = self._last_display_items
+        self._refresh_view(candidates)
         self._update_drag_drop_state()
 
     def _on_search_submitted(self) -> None:
@@ -537,35 +626,61 @@ class NodeContentBrowser(QWidget):
             return
         self._icon_size_level = clamped
         self._icon_size = self._icon_size_from_level(self._icon_size_level)
+        # 例外時にもシグナル遮断が解除されるよう QSignalBlocker を用いる。
         if self._icon_size_slider.value() != clamped:
-            self._icon_size_slider.blockSignals(True)
-            self._icon_size_slider.setValue(clamped)
-            self._icon_size_slider.blockSignals(False)
+            with QSignalBlocker(self._icon_size_slider):
+                self._icon_size_slider.setValue(clamped)
         if self._icon_size_spin.value() != clamped:
-            self._icon_size_spin.blockSignals(True)
-            self._icon_size_spin.setValue(clamped)
-            self._icon_size_spin.blockSignals(False)
+            with QSignalBlocker(self._icon_size_spin):
+                self._icon_size_spin.setValue(clamped)
+        if self._icon_size_slider.isSliderDown():
+            self._icon_size_timer.start()
+            return
+        self._icon_size_timer.stop()
         self._apply_icon_size()
 
+    def _flush_pending_icon_size(self) -> None:
+        if self._icon_size_timer.isActive():
+            self._icon_size_timer.stop()
+            self._apply_icon_size()
+
     def _apply_icon_size(self) -> None:
         icon_size_value = self._current_icon_size_value()
         icon_size = QSize(icon_size_value, icon_size_value)
-        self._available_view.setIconSize(icon_size)
-        self._available_view.setGridSize(self._grid_size(icon_size_value))
-        self._refresh_icons()
+        # アイコンサイズ・グリッド・アイコン差し替えの再描画を 1 回にまとめる。
+        view = self._available_view
+        view.setUpdatesEnabled(False)
+        try:
+            # QListView.setGridSize は同値でも再レイアウトを予約するため、変化時のみ設定する。
+            if view.iconSize() != icon_size:
+                view.setIconSize(icon_size)
+            grid_size = self._grid_size(icon_size_value)
+            if view.gridSize() != grid_size:
+                view.setGridSize(grid_size)
+            # 表示中の行は _refresh_view で現在のサイズのアイコンを受け取っているため、
+            # サイズが変わった場合のみ差し替える。
+            if icon_size_value != self._applied_icon_size:
+                self._refresh_icons()
+        finally:
+            view.setUpdatesEnabled(True)
+        self._applied_icon_size = icon_size_value
         tooltip = (
             f"表示サイズ: {icon_size_value}px"
             f" / {self._icon_size_level} 段階 ({len(self._icon_size_levels)}段階中)"
         )
         self._icon_size_slider.setToolTip(tooltip)
         self._icon_size_spin.setToolTip(tooltip)
-        if self._result_summary_label is not None and self._visible_entry_count:
-            self._update_summary_label()
 
     def _update_layout_for_size(self, size: QSize) -> None:
         width = size.width() if size is not None else self.width()
-        self._adjust_control_header(width)
-        self._apply_icon_size()
+        # 幅で変わるのはヘッダーの向きだけで、アイコン配置は幅に依存しない。
+        # 境界をまたがないリサイズでは何もしない。
+        is_vertical = width < 720
+        if is_vertical != self._header_vertical:
+            self._adjust_control_header(width)
+            self._header_vertical = is_vertical
+        if self._applied_icon_size != self._current_icon_size_value():
+            self._apply_icon_size()
 
     def _adjust_control_header(self, width: int) -> None:
         if self._control_header_layout is None:
@@ -599,9 +714,9 @@ class NodeContentBrowser(QWidget):
             self._control_header.updateGeometry()
         self._control_header_layout.invalidate()
 
-    def _refresh_view(self) -> None:
-        self._available_model.clear()
-        items = self._current_display_items()
+    def _refresh_view(self, candidates: Optional[Sequence[CatalogItem]] = None) -> None:
+        items = self._current_display_items(candidates)
+        model_items: List[QStandardItem] = []
         for catalog_item in items:
             item = QStandardItem(self._format_item_text(catalog_item))
             item.setEditable(False)
@@ -622,9 +737,21 @@ class NodeContentBrowser(QWidget):
                     | Qt.ItemIsSelectable
                     | Qt.ItemIsDragEnabled
                 )
-            self._available_model.appendRow(item)
+            model_items.append(item)
+        # 再描画を止めた状態で入れ替え、行の追加通知も 1 回にまとめる。
+        view = self._available_view
+        view.setUpdatesEnabled(False)
+        try:
+            self._available_model.clear()
+            if model_items:
+                self._available_model.invisibleRootItem().appendRows(model_items)
+        finally:
+            view.setUpdatesEnabled(True)
+        self._last_display_items = items
+        self._last_display_folder = self._current_folder
+        self._last_display_keyword = self._search_keyword
         self._update_path_label()
-        self._update_summary_label()
+        self._update_summary_label(items)
         self._update_drag_drop_state()
 
     def _refresh_icons(self) -> None:
@@ -635,9 +762,8 @@ class NodeContentBrowser(QWidget):
             catalog_item = item.data(Qt.UserRole)
             if not isinstance(catalog_item, CatalogItem):
                 continue
-            if catalog_item.is_folder():
-                item.setIcon(self._folder_icon)
-            else:
+            # フォルダアイコンはサイズに依存しない共通アイコンのため再設定しない。
+            if catalog_item.is_entry():
                 item.setIcon(self._icon_for_entry(catalog_item.entry))
 
     def _update_drag_drop_state(self) -> None:
@@ -646,34 +772,40 @@ class NodeContentBrowser(QWidget):
         self._available_view.setAcceptDrops(not filtered)
         self._available_view.setDropIndicatorShown(not filtered)
 
-    def _current_display_items(self) -> List[CatalogItem]:
-        items: List[CatalogItem] = []
+    def _current_display_items(
+        self, candidates: Optional[Sequence[CatalogItem]] = None
+    ) -> List[CatalogItem]:
         keyword = self._search_keyword
-        for item in self._current_folder.items:
+        source = self._current_folder.items if candidates is None else candidates
+        if not keyword:
+            # 絞り込み無しではキーワード判定を行わず、フォルダとエントリをそのまま並べる。
+            return [item for item in source if item.is_folder() or item.entry is not None]
+        items: List[CatalogItem] = []
+        for item in source:
             if item.is_folder():
-                if not keyword or self._folder_has_match(item.folder, keyword):
+                if self._folder_has_match(item.folder, keyword):
                     items.append(item)
-            elif self._entry_matches(item.entry, keyword):
+            elif item.entry is not None and keyword in item.entry.searchable_text():
                 items.append(item)
         return items
 
     def _folder_has_match(self, folder: Optional[CatalogFolder], keyword: str) -> bool:
         if folder is None:
             return False
-        for item in folder.items:
-            if item.is_folder():
-                if self._folder_has_match(item.folder, keyword):
-                    return True
-            elif self._entry_matches(item.entry, keyword):
-                return True
-        return False
+        cached = self._folder_search_texts.get(id(folder))
+        if cached is None or cached[0] is not folder:
+            texts = tuple(
+                item.entry.searchable_text()
+                for item in folder.iter_items()
+                if item.is_entry() and item.entry is not None
+            )
+            cached = (folder, texts)
+            self._folder_search_texts[id(folder)] = cached
+        return any(keyword in text for text in cached[1])
 
-    def _entry_matches(self, entry: Optional[NodeCatalogEntry], keyword: str) -> bool:
-        if entry is None:
-            return False
-        if not keyword:
-            return True
-        return keyword in entry.searchable_text()
+    def _invalidate_search_texts(self) -> None:
+        self._folder_search_texts.clear()
+        self._layout_revision += 1
 
     def _format_item_text(self, item: CatalogItem) -> str:
         if item.is_folder():
@@ -681,27 +813,14 @@ class NodeContentBrowser(QWidget):
         entry = item.entry
         if entry is None:
             return item.title
-        title = entry.title.strip()
-        subtitle = entry.subtitle.strip()
-        if title and subtitle:
-            return f"{title}\n{subtitle}"
-        return title or subtitle or entry.node_type.strip()
+        return entry.display_text
 
-    def _update_summary_label(self) -> None:
+    def _update_summary_label(self, items: Sequence[CatalogItem]) -> None:
         if self._result_summary_label is None:
             return
-        visible_entries = 0
-        visible_folders = 0
-        for row in range(self._available_model.rowCount()):
-            item = self._available_model.item(row)
-            if item is None:
-                continue
-            catalog_item = item.data(Qt.UserRole)
-            if isinstance(catalog_item, CatalogItem):
-                if catalog_item.is_folder():
-                    visible_folders += 1
-                else:
-                    visible_entries += 1
+        # モデルの行を引き直さず、表示に使った項目列から件数を数える。
+        visible_folders = sum(1 for item in items if item.is_folder())
+        visible_entries = len(items) - visible_folders
         total_entries = sum(1 for item in self._current_folder.items if item.is_entry())
         self._visible_entry_count = visible_entries
         text = (
@@ -770,6 +889,7 @@ class NodeContentBrowser(QWidget):
         for item in items:
             if item in self._current_folder.items:
                 self._current_folder.items.remove(item)
+        self._invalidate_search_texts()
         if items:
             self._persist_layout()
 
@@ -822,6 +942,7 @@ class NodeContentBrowser(QWidget):
         new_folder = CatalogFolder(name=name, parent=self._current_folder)
         new_item = CatalogItem(kind="folder", title=name, folder=new_folder)
         self._current_folder.items.append(new_item)
+        self._invalidate_search_texts()
         self._persist_layout()
         self._refresh_view()
 
@@ -866,6 +987,7 @@ class NodeContentBrowser(QWidget):
             if item.is_folder() and item.folder is not None:
                 item.folder.parent = target_folder
             target_folder.items.append(item)
+        self._invalidate_search_texts()
 
     def _copy_items_to_folder(
         self,
@@ -882,6 +1004,7 @@ class NodeContentBrowser(QWidget):
                 target_folder.items.append(
                     CatalogItem(kind="entry", title=item.title, entry=item.entry)
                 )
+        self._invalidate_search_texts()
         if items:
             self._persist_layout()
 
@@ -934,6 +1057,7 @@ class NodeContentBrowser(QWidget):
                 new_order.append(catalog_item)
         if new_order:
             self._current_folder.items = new_order
+            self._last_display_items = list(new_order)
 
     def _sync_catalog_entries(self, entries: Sequence[NodeCatalogEntry]) -> None:
         if not self._root_folder.items:
@@ -958,6 +1082,7 @@ class NodeContentBrowser(QWidget):
 
         if self._current_folder is None or self._current_folder.parent is None:
             self._current_folder = self._root_folder
+        self._invalidate_search_texts()
 
     def _load_layout(self) -> None:
         raw = self._settings_store.value(self._layout_storage_key, "")
@@ -988,6 +1113,7 @@ class NodeContentBrowser(QWidget):
         self._root_folder = root
         self._ensure_default_folders()
         self._current_folder = self._root_folder
+        self._invalidate_search_texts()
 
     def _deserialize_item(
         self,
@@ -1069,6 +1195,7 @@ class NodeContentBrowser(QWidget):
             CatalogItem(kind="folder", title=environment.name, folder=environment),
         ]
         self._current_folder = self._root_folder
+        self._invalidate_search_texts()
 
     def _entry_items_by_type(self) -> Dict[str, CatalogItem]:
         items: Dict[str, CatalogItem] = {}
@@ -1123,13 +1250,20 @@ class NodeContentBrowser(QWidget):
         return None
 
     def _grid_size(self, icon_size: int) -> QSize:
+        # フォント計測は文字列整形を伴うため、アイコンサイズとフォントの組で結果を再利用する。
+        cache_key = (icon_size, self._available_view.font().key())
+        cached = self._grid_size_cache.get(cache_key)
+        if cached is not None:
+            return QSize(cached)
         font: QFontMetrics = self._available_view.fontMetrics()
         line_spacing = font.lineSpacing()
         text_height = line_spacing * 2
         height = icon_size + text_height + 16
         text_width = font.horizontalAdvance("M" * 12)
         width = max(icon_size + 24, text_width)
-        return QSize(width, height)
+        size = QSize(width, height)
+        self._grid_size_cache[cache_key] = QSize(size)
+        return size
 
     def _icon_size_from_level(self, level: int) -> int:
         return self._icon_size_levels.get(
@@ -1164,6 +1298,8 @@ class NodeContentBrowser(QWidget):
         file_info = QFileInfo(path)
         if not file_info.exists():
             return None
+        if self._file_icon_provider is None:
+            self._file_icon_provider = QFileIconProvider()
         icon = self._file_icon_provider.icon(file_info)
         if icon.isNull():
             return None
@@ -1216,15 +1352,7 @@ class NodeContentBrowser(QWidget):
         return pixmap
 
     def _genre_color(self, genre: str) -> QColor:
-        palette = {
-            "ツール環境": QColor(14, 165, 233),
-            "ワークフロー": QColor(34, 197, 94),
-            "メモ": QColor(249, 115, 22),
-        }
-        color = palette.get(genre)
-        if color is None:
-            color = QColor(99, 102, 241)
-        return color
+        return _GENRE_COLORS.get(genre, _DEFAULT_GENRE_COLOR)
 
     def _icon_label_text(self, source_text: str) -> str:
         for char in source_text:
@@ -1236,10 +1364,7 @@ class NodeContentBrowser(QWidget):
 
     def _guess_genre(self, node_type: str) -> str:
         normalized = node_type.strip()
-        if normalized.startswith("tool-environment:") or normalized.startswith("sotugyo.tooling"):
-            return "ツール環境"
-        if normalized.startswith("sotugyo.demo."):
-            return "ワークフロー"
-        if normalized.startswith("sotugyo.memo.") or normalized.startswith("sotugyo.date."):
-            return "メモ"
+        for prefixes, genre in _GENRE_PREFIXES:
+            if normalized.startswith(prefixes):
+                return genre
         return "その他"
@@ -842,7 +842,6 @@ QLabel#startDescription {
 # ノードエディタ用の背景配色。縞模様タイルを描画する際に利用する。
 GRAPH_VIEW_STRIPE_LIGHT = QColor("#101a32")
 GRAPH_VIEW_STRIPE_DARK = QColor("#0b1527")
-GRAPH_VIEW_STRIPE_BORDER = QColor("#1f2c49")
 GRAPH_VIEW_STRIPE_ACCENT = QColor("#233757")
 
 
@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from typing import Iterable, Sequence, Type
 
 from qtpy import QtCore, QtGui
 
 from sotugyo.qt_compat import ensure_qt_module_alias
 
+Qt = QtCore.Qt
+QLine = QtCore.QLine
 QSize = QtCore.QSize
 QBrush = QtGui.QBrush
 QColor = QtGui.QColor
 QPainter = QtGui.QPainter
 QPen = QtGui.QPen
 QPixmap = QtGui.QPixmap
+QPixmapCache = QtGui.QPixmapCache
 
 ensure_qt_module_alias()
 from NodeGraphQt import NodeGraph
@@ -23,14 +28,17 @@ from NodeGraphQt.nodes.base_node import BaseNode
 
 from ...style import (
     GRAPH_VIEW_STRIPE_ACCENT,
-    GRAPH_VIEW_STRIPE_BORDER,
     GRAPH_VIEW_STRIPE_DARK,
     GRAPH_VIEW_STRIPE_LIGHT,
 )
 
 
+@lru_cache(maxsize=None)
 def resolve_stripe_width(node_cls: Type[BaseNode]) -> int:
-    """基準ノードのビュー幅から縞幅を取得する。"""
+    """基準ノードのビュー幅から縞幅を取得する。
+
+    幅の計測にはノードの生成が必要なため、結果はクラス単位でキャッシュする。
+    """
 
     node = node_cls()
     try:
@@ -65,7 +73,6 @@ def _build_stripe_tile(
     stripe_height: int,
     light_color: QColor,
     dark_color: QColor,
-    border_color: QColor,
     accent_color: QColor,
 ) -> QPixmap:
     """縞模様用のタイル画像を生成する。"""
@@ -92,34 +99,64 @@ def _build_stripe_tile(
 
     painter = QPainter(pixmap)
 
-    border_pen = QPen(border_color)
-    border_pen.setWidth(1)
-    border_pen.setCosmetic(True)
-
     accent_pen = QPen(accent_color)
     accent_pen.setWidth(1)
     accent_pen.setCosmetic(True)
 
-    offset = 0
-    painter.setPen(border_pen)
-    painter.drawLine(0, 0, 0, tile_height)
+    offsets = list(accumulate((segment.width for segment in sanitized_segments), initial=0))
+    stripe_palette = (light_stripe_color, dark_stripe_color)
+    accent_lines: list[QLine] = []
     for index, segment in enumerate(sanitized_segments):
         stripe_color = segment.color
         if stripe_color is None:
-            stripe_color = light_stripe_color if index % 2 == 0 else dark_stripe_color
-        painter.fillRect(offset, 0, segment.width, tile_height, stripe_color)
-        offset += segment.width
-        painter.setPen(border_pen)
-        painter.drawLine(offset, 0, offset, tile_height)
-        if segment.color is None and index % 2 == 0:
-            accent_x = max(offset - 1, 0)
-            painter.setPen(accent_pen)
-            painter.drawLine(accent_x, 0, accent_x, tile_height)
+            stripe_color = stripe_palette[index & 1]
+        painter.fillRect(offsets[index], 0, segment.width, tile_height, stripe_color)
+        if segment.color is None and not index & 1:
+            accent_x = max(offsets[index + 1] - 1, 0)
+            accent_lines.append(QLine(accent_x, 0, accent_x, tile_height))
+
+    # 縞の左端に引いていた境界線は直後の fillRect で必ず塗り潰されるため描画しない。
+    # アクセント線は座標を先に求め、drawLines の 1 回の呼び出しでまとめて描画する。
+    if accent_lines:
+        painter.setPen(accent_pen)
+        painter.drawLines(accent_lines)
 
     painter.end()
     return pixmap
 
 
+def _cached_stripe_tile(
+    stripe_segments: Sequence[StripeSegment],
+    *,
+    stripe_height: int,
+    light_color: QColor,
+    dark_color: QColor,
+    accent_color: QColor,
+) -> QPixmap:
+    """QPixmapCache を介して縞タイルを取得する。"""
+
+    segment_key = ",".join(
+        f"{segment.width}#{segment.color.rgba() if segment.color is not None else '-'}"
+        for segment in stripe_segments
+    )
+    key = (
+        f"stripe:{segment_key}:{stripe_height}:"
+        f"{light_color.rgba()}:{dark_color.rgba()}:{accent_color.rgba()}"
+    )
+    pixmap = QPixmap()
+    if QPixmapCache.find(key, pixmap):
+        return pixmap
+    pixmap = _build_stripe_tile(
+        stripe_segments,
+        stripe_height=stripe_height,
+        light_color=light_color,
+        dark_color=dark_color,
+        accent_color=accent_color,
+    )
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class StripedBackgroundPattern:
     """縞幅のシーケンスを保持しブラシ生成を担うヘルパー。"""
 
@@ -132,7 +169,7 @@ class StripedBackgroundPattern:
         segments = self._normalize_segments(stripe_segments)
         if not segments:
             raise ValueError("stripe_segments must contain at least one positive width.")
-        self._segments = segments
+        self._assign_segments(segments)
         height = int(stripe_height) if stripe_height is not None else segments[0].width
         self._height = max(height, 2)
         self._brush_cache: QBrush | None = None
@@ -141,13 +178,13 @@ class StripedBackgroundPattern:
     def widths(self) -> tuple[int, ...]:
         """現在の縞幅シーケンスを返す。"""
 
-        return tuple(segment.width for segment in self._segments)
+        return self._widths
 
     @property
     def segments(self) -> tuple[StripeSegment, ...]:
         """現在の縞セグメントを返す。"""
 
-        return tuple(self._segments)
+        return self._segments
 
     @property
     def height(self) -> int:
@@ -158,12 +195,12 @@ class StripedBackgroundPattern:
     def total_width(self) -> int:
         """タイル全体の幅を返す。"""
 
-        return sum(self.widths)
+        return self._total_width
 
     def width_at(self, index: int) -> int:
         """指定インデックスの縞幅を取得する。"""
 
-        return self._segments[index].width
+        return self._widths[index]
 
     def update_segments(
         self,
@@ -176,7 +213,7 @@ class StripedBackgroundPattern:
         segments = self._normalize_segments(stripe_segments)
         if not segments:
             raise ValueError("stripe_segments must contain at least one positive width.")
-        self._segments = segments
+        self._assign_segments(segments)
         if stripe_height is not None:
             height = int(stripe_height)
             self._height = max(height, 2)
@@ -190,17 +227,21 @@ class StripedBackgroundPattern:
         if self._brush_cache is not None:
             return self._brush_cache
 
-        tile = _build_stripe_tile(
+        tile = _cached_stripe_tile(
             self._segments,
             stripe_height=self._height,
             light_color=GRAPH_VIEW_STRIPE_LIGHT,
             dark_color=GRAPH_VIEW_STRIPE_DARK,
-            border_color=GRAPH_VIEW_STRIPE_BORDER,
             accent_color=GRAPH_VIEW_STRIPE_ACCENT,
         )
         self._brush_cache = QBrush(tile)
         return self._brush_cache
 
+    def _assign_segments(self, segments: list[StripeSegment]) -> None:
+        self._segments: tuple[StripeSegment, ...] = tuple(segments)
+        self._widths: tuple[int, ...] = tuple(segment.width for segment in segments)
+        self._total_width = sum(self._widths)
+
     @staticmethod
     def _normalize_segments(
         stripe_segments: Iterable[int | StripeSegment],
@@ -228,11 +269,22 @@ def apply_stripe_pattern(graph: NodeGraph, pattern: StripedBackgroundPattern) ->
     current_hints = viewer.renderHints()
     if not (current_hints & QPainter.SmoothPixmapTransform):
         viewer.setRenderHints(current_hints | QPainter.SmoothPixmapTransform)
-    viewer.setBackgroundBrush(brush)
-    graph.scene().setBackgroundBrush(brush)
+    # 同一タイルのブラシを再設定するとシーン全体が再描画されるため、
+    # テクスチャの cacheKey が一致する場合は設定を省略する。
+    if not _has_same_texture(viewer.backgroundBrush(), brush):
+        viewer.setBackgroundBrush(brush)
+    scene = graph.scene()
+    if not _has_same_texture(scene.backgroundBrush(), brush):
+        scene.setBackgroundBrush(brush)
     return brush
 
 
+def _has_same_texture(current: QBrush, brush: QBrush) -> bool:
+    if current.style() != Qt.TexturePattern:
+        return False
+    return current.texture().cacheKey() == brush.texture().cacheKey()
+
+
 def apply_dynamic_striped_background(
     graph: NodeGraph,
     stripe_segments: Iterable[int | StripeSegment],
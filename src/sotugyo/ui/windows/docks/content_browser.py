@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
 
-from qtpy import QtCore, QtWidgets
+from qtpy import QtCore, QtGui, QtWidgets
 
 Qt = QtCore.Qt
 Signal = QtCore.Signal
+QShowEvent = QtGui.QShowEvent
 QDockWidget = QtWidgets.QDockWidget
 QVBoxLayout = QtWidgets.QVBoxLayout
 QWidget = QtWidgets.QWidget
@@ -16,7 +17,11 @@ from ...components.content_browser import NodeCatalogEntry, NodeContentBrowser
 
 
 class NodeContentBrowserDock(QDockWidget):
-    """ノードカタログ表示を提供するドックウィジェット。"""
+    """ノードカタログ表示を提供するドックウィジェット。
+
+    ブラウザ本体は初回表示時に生成し、それまでに受け取ったカタログは
+    保留しておき生成直後に反映する。
+    """
 
     node_type_requested = Signal(str)
     search_submitted = Signal(str)
@@ -31,37 +36,59 @@ class NodeContentBrowserDock(QDockWidget):
             | QDockWidget.DockWidgetClosable
         )
 
-        browser = NodeContentBrowser(self)
-        browser.setMinimumHeight(160)
-        browser.node_type_requested.connect(self.node_type_requested)
-        browser.search_submitted.connect(self.search_submitted)
-
         container = QWidget(self)
         container.setObjectName("dockContentContainer")
+        container.setMinimumHeight(160)
         layout = QVBoxLayout(container)
         layout.setContentsMargins(12, 0, 12, 12)
         layout.setSpacing(0)
-        layout.addWidget(browser)
         self.setWidget(container)
 
-        self._browser = browser
+        self._container_layout = layout
+        self._browser: Optional[NodeContentBrowser] = None
+        self._pending_entries: Optional[List[NodeCatalogEntry]] = None
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: D401
+        """初回表示時にブラウザを生成する。"""
+
+        self._ensure_browser()
+        super().showEvent(event)
 
     def set_catalog_entries(self, entries: Iterable[NodeCatalogEntry]) -> None:
         """ブラウザにカタログを設定する。"""
 
+        if self._browser is None:
+            self._pending_entries = list(entries)
+            return
         self._browser.set_catalog_entries(entries)
 
     def focus_search(self) -> None:
         """検索入力へフォーカスを移す。"""
 
-        self._browser.focus_search()
+        self._ensure_browser().focus_search()
 
     def first_visible_available_type(self) -> Optional[str]:
         """現在表示されているエントリのうち最初のノード種別を取得する。"""
 
-        return self._browser.first_visible_available_type()
+        return self._ensure_browser().first_visible_available_type()
 
     def current_search_text(self) -> str:
         """検索入力の現在値を返す。"""
 
+        if self._browser is None:
+            return ""
         return self._browser.current_search_text()
+
+    def _ensure_browser(self) -> NodeContentBrowser:
+        if self._browser is not None:
+            return self._browser
+        browser = NodeContentBrowser(self.widget())
+        browser.setMinimumHeight(160)
+        browser.node_type_requested.connect(self.node_type_requested)
+        browser.search_submitted.connect(self.search_submitted)
+        self._container_layout.addWidget(browser)
+        self._browser = browser
+        if self._pending_entries is not None:
+            entries, self._pending_entries = self._pending_entries, None
+            browser.set_catalog_entries(entries)
+        return browser
@@ -2,26 +2,96 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Optional, Tuple
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
 
 from qtpy import QtCore, QtWidgets
 
 Qt = QtCore.Qt
 Signal = QtCore.Signal
+QTimer = QtCore.QTimer
+QAbstractTableModel = QtCore.QAbstractTableModel
+QModelIndex = QtCore.QModelIndex
+QSignalBlocker = QtCore.QSignalBlocker
+QAbstractItemView = QtWidgets.QAbstractItemView
 QDockWidget = QtWidgets.QDockWidget
 QFrame = QtWidgets.QFrame
 QFormLayout = QtWidgets.QFormLayout
+QHeaderView = QtWidgets.QHeaderView
 QHBoxLayout = QtWidgets.QHBoxLayout
 QLabel = QtWidgets.QLabel
 QLineEdit = QtWidgets.QLineEdit
 QPushButton = QtWidgets.QPushButton
 QSpinBox = QtWidgets.QSpinBox
 QTabWidget = QtWidgets.QTabWidget
-QTextEdit = QtWidgets.QTextEdit
+QTableView = QtWidgets.QTableView
 QPlainTextEdit = QtWidgets.QPlainTextEdit
 QVBoxLayout = QtWidgets.QVBoxLayout
 QWidget = QtWidgets.QWidget
 
+_SECTION_OBJECT_NAME = "inspectorSection"
+_TITLE_OBJECT_NAME = "panelTitle"
+_SECTION_MARGINS = (20, 20, 20, 20)
+_DOCK_MARGINS = (12, 12, 12, 12)
+_MEMO_EMIT_INTERVAL_MS = 150
+_DASH = "-"
+_PLACEHOLDER_ROWS: Tuple[Tuple[str, str], ...] = ((_DASH, _DASH),)
+
+
+class _PropertyModel(QAbstractTableModel):
+    """キーと値の組を 2 列で表示する読み取り専用モデル。"""
+
+    _HEADERS = ("キー", "値")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: Sequence[Tuple[str, str]] = ()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole,
+    ):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        return self._HEADERS[section]
+
+    def set_rows(self, rows: Sequence[Tuple[str, str]]) -> bool:
+        """表示行を置き換え、変更があったかを返す。内容が同一なら何もしない。"""
+
+        previous = self._rows
+        if rows is previous or rows == previous:
+            return False
+        # モデル全体をリセットせず、行数の増減分だけを挿入・削除し、
+        # 残る行は dataChanged で内容の差し替えとして通知する。
+        old_count = len(previous)
+        new_count = len(rows)
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = rows
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = rows
+            self.endInsertRows()
+        else:
+            self._rows = rows
+        shared = min(old_count, new_count)
+        if shared:
+            self.dataChanged.emit(self.index(0, 0), self.index(shared - 1, 1))
+        return True
+
 
 class NodeInspectorPanel(QWidget):
     """ノードの詳細と編集操作をまとめたパネル。"""
@@ -40,19 +110,37 @@ class NodeInspectorPanel(QWidget):
     ) -> None:
         super().__init__(parent)
         self._memo_font_range = memo_font_range
+        # 文字サイズの丸めで毎回タプルを展開しないよう、上下限を個別に保持する。
+        self._memo_font_min, self._memo_font_max = memo_font_range
         self._memo_font_default = memo_font_default
-        self._memo_controls_active = False
 
-        self._detail_name_label = QLabel("-", self)
-        self._detail_type_label = QLabel("-", self)
-        self._detail_uuid_label = QLabel("-", self)
-        self._detail_position_label = QLabel("-", self)
-        self._detail_children_label = QLabel("-", self)
+        self._detail_name_label = QLabel(_DASH, self)
+        self._detail_type_label = QLabel(_DASH, self)
+        self._detail_uuid_label = QLabel(_DASH, self)
+        self._detail_position_label = QLabel(_DASH, self)
+        self._detail_children_label = QLabel(_DASH, self)
         self._detail_children_label.setWordWrap(True)
-        self._property_plain_text = QPlainTextEdit(self)
-        self._property_plain_text.setReadOnly(True)
-        self._property_plain_text.setPlaceholderText("選択中ノードのプロパティ一覧がここに表示されます。")
-        self._property_plain_text.setMinimumHeight(140)
+        self._detail_labels = (
+            self._detail_name_label,
+            self._detail_type_label,
+            self._detail_uuid_label,
+            self._detail_position_label,
+            self._detail_children_label,
+        )
+        self._empty_details: Tuple[str, ...] = (_DASH,) * len(self._detail_labels)
+        self._last_details = self._empty_details
+        self._property_model = _PropertyModel(self)
+        self._property_table = QTableView(self)
+        self._property_table.setModel(self._property_model)
+        self._property_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._property_table.setSelectionMode(QAbstractItemView.NoSelection)
+        self._property_table.verticalHeader().setVisible(False)
+        header = self._property_table.horizontalHeader()
+        # ResizeToContents はビューのリサイズ毎に全行を走査するため、
+        # 幅は行の入れ替え時にだけ _populate_property_rows で合わせる。
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        self._property_table.setMinimumHeight(140)
         self._tool_launch_label = QLabel("起動対象: -", self)
         self._tool_launch_label.setWordWrap(True)
         self._tool_launch_button = QPushButton("ツールを起動", self)
@@ -60,15 +148,22 @@ class NodeInspectorPanel(QWidget):
         self._tool_launch_button.clicked.connect(self._emit_tool_launch_request)
 
         self._rename_input = QLineEdit(self)
+        self._rename_input.setPlaceholderText("ノード名を入力")
         self._rename_button = QPushButton("名前を更新", self)
         self._rename_button.clicked.connect(self._emit_rename_request)
         self._rename_input.returnPressed.connect(self._emit_rename_request)
 
-        self._memo_text_edit = QTextEdit(self)
-        self._memo_text_edit.setAcceptRichText(False)
-        self._memo_text_edit.setPlaceholderText("メモノードの内容を入力")
-        self._memo_text_edit.setMinimumHeight(140)
-        self._memo_text_edit.textChanged.connect(self._on_memo_text_changed)
+        # メモ編集欄は文書・取り消し履歴を抱える重い部品のため、
+        # 「ノード操作」タブが初めて表示された時に生成する。
+        self._memo_text_edit: Optional[QPlainTextEdit] = None
+        self._memo_enabled = False
+
+        # 入力ごとに全文を転送せず、入力が途切れた時点でまとめて通知する。
+        self._memo_emit_timer = QTimer(self)
+        self._memo_emit_timer.setSingleShot(True)
+        self._memo_emit_timer.setInterval(_MEMO_EMIT_INTERVAL_MS)
+        self._memo_emit_timer.timeout.connect(self._flush_memo_text)
+        self._memo_plain = ""
 
         self._memo_font_spin = QSpinBox(self)
         self._memo_font_spin.setRange(*self._memo_font_range)
@@ -77,9 +172,17 @@ class NodeInspectorPanel(QWidget):
 
         self._tabs = QTabWidget(self)
         self._tabs.setMinimumWidth(260)
+        # 先頭タブのみ即座に組み立て、残りは初めて表示された時に組み立てる。
+        # 遅延中のタブの部品は空ページへ預けておき、先に内容を更新できるようにする。
+        self._pending_tabs: Dict[int, Tuple[QWidget, Callable[[], QWidget]]] = {}
         self._tabs.addTab(self._build_property_tab(), "プロパティ")
-        self._tabs.addTab(self._build_detail_tab(), "ノード詳細")
-        self._tabs.addTab(self._build_operation_tab(), "ノード操作")
+        self._add_deferred_tab("ノード詳細", self._build_detail_tab, self._detail_labels)
+        self._add_deferred_tab(
+            "ノード操作",
+            self._build_operation_tab,
+            (self._rename_input, self._rename_button, self._memo_font_spin),
+        )
+        self._tabs.currentChanged.connect(self._materialize_tab)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -88,11 +191,32 @@ class NodeInspectorPanel(QWidget):
         self.disable_rename()
         self.clear_memo()
 
+    def _add_deferred_tab(
+        self,
+        title: str,
+        builder: Callable[[], QWidget],
+        widgets: Iterable[QWidget],
+    ) -> None:
+        page = QWidget(self._tabs)
+        for widget in widgets:
+            widget.setParent(page)
+        index = self._tabs.addTab(page, title)
+        self._pending_tabs[index] = (page, builder)
+
+    def _materialize_tab(self, index: int) -> None:
+        pending = self._pending_tabs.pop(index, None)
+        if pending is None:
+            return
+        page, builder = pending
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(builder())
+
     def _build_detail_tab(self) -> QWidget:
         widget = QFrame(self)
-        widget.setObjectName("inspectorSection")
+        widget.setObjectName(_SECTION_OBJECT_NAME)
         layout = QFormLayout(widget)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setContentsMargins(*_SECTION_MARGINS)
         layout.setSpacing(10)
         layout.addRow("名前", self._detail_name_label)
         layout.addRow("タイプ", self._detail_type_label)
@@ -103,12 +227,12 @@ class NodeInspectorPanel(QWidget):
 
     def _build_property_tab(self) -> QWidget:
         widget = QFrame(self)
-        widget.setObjectName("inspectorSection")
+        widget.setObjectName(_SECTION_OBJECT_NAME)
         layout = QVBoxLayout(widget)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setContentsMargins(*_SECTION_MARGINS)
         layout.setSpacing(10)
 
-        layout.addWidget(self._property_plain_text)
+        layout.addWidget(self._property_table)
         layout.addSpacing(8)
         layout.addWidget(self._tool_launch_label)
         layout.addWidget(self._tool_launch_button)
@@ -116,24 +240,23 @@ class NodeInspectorPanel(QWidget):
 
     def _build_operation_tab(self) -> QWidget:
         widget = QFrame(self)
-        widget.setObjectName("inspectorSection")
+        widget.setObjectName(_SECTION_OBJECT_NAME)
         layout = QVBoxLayout(widget)
-        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setContentsMargins(*_SECTION_MARGINS)
         layout.setSpacing(12)
 
         rename_label = QLabel("名前の変更", widget)
-        rename_label.setObjectName("panelTitle")
+        rename_label.setObjectName(_TITLE_OBJECT_NAME)
         layout.addWidget(rename_label)
 
-        self._rename_input.setPlaceholderText("ノード名を入力")
         layout.addWidget(self._rename_input)
         layout.addWidget(self._rename_button)
 
         memo_label = QLabel("メモ編集", widget)
-        memo_label.setObjectName("panelTitle")
+        memo_label.setObjectName(_TITLE_OBJECT_NAME)
         layout.addWidget(memo_label)
 
-        layout.addWidget(self._memo_text_edit)
+        layout.addWidget(self._ensure_memo_text_edit())
 
         memo_font_layout = QHBoxLayout()
         memo_font_label = QLabel("文字サイズ", widget)
@@ -144,48 +267,67 @@ class NodeInspectorPanel(QWidget):
         layout.addStretch(1)
         return widget
 
+    def _ensure_memo_text_edit(self) -> QPlainTextEdit:
+        editor = self._memo_text_edit
+        if editor is not None:
+            return editor
+        editor = QPlainTextEdit(self)
+        editor.setPlaceholderText("メモノードの内容を入力")
+        editor.setMinimumHeight(140)
+        editor.setPlainText(self._memo_plain)
+        editor.setEnabled(self._memo_enabled)
+        editor.textChanged.connect(self._on_memo_text_changed)
+        self._memo_text_edit = editor
+        return editor
+
     def update_node_details(
         self,
         *,
         name: str,
-        node_type: object,
+        node_type: str,
         node_uuid: str,
         position_text: str,
         children_text: str,
     ) -> None:
         """選択ノードの詳細情報を表示する。"""
 
-        self._detail_name_label.setText(name or "-")
-        self._detail_type_label.setText(str(node_type) if node_type else "-")
-        self._detail_uuid_label.setText(node_uuid or "-")
-        self._detail_position_label.setText(position_text or "-")
-        self._detail_children_label.setText(children_text or "-")
+        self._apply_details(
+            (
+                name or _DASH,
+                node_type or _DASH,
+                node_uuid or _DASH,
+                position_text or _DASH,
+                children_text or _DASH,
+            )
+        )
 
     def clear_node_details(self) -> None:
         """詳細情報をリセットする。"""
 
-        self._detail_name_label.setText("-")
-        self._detail_type_label.setText("-")
-        self._detail_uuid_label.setText("-")
-        self._detail_position_label.setText("-")
-        self._detail_children_label.setText("-")
+        self._apply_details(self._empty_details)
         self.clear_properties()
 
+    def _apply_details(self, values: Tuple[str, ...]) -> None:
+        previous = self._last_details
+        if values is previous or values == previous:
+            return
+        for label, old, new in zip(self._detail_labels, previous, values):
+            if old != new:
+                label.setText(new)
+        self._last_details = values
+
     def enable_rename(self, value: str) -> None:
         """リネーム操作を有効化する。"""
 
-        self._rename_input.blockSignals(True)
+        # 入力欄は returnPressed しか接続していないため、setText でシグナルを抑止する必要はない。
         self._rename_input.setText(value)
         self._rename_input.setEnabled(True)
-        self._rename_input.blockSignals(False)
         self._rename_button.setEnabled(True)
 
     def disable_rename(self) -> None:
         """リネーム操作を無効化する。"""
 
-        self._rename_input.blockSignals(True)
         self._rename_input.clear()
-        self._rename_input.blockSignals(False)
         self._rename_input.setEnabled(False)
         self._rename_button.setEnabled(False)
 
@@ -193,36 +335,67 @@ class NodeInspectorPanel(QWidget):
         """メモ編集欄へ内容を反映する。"""
 
         normalized_size = self._normalize_font_size(font_size)
-        self._memo_controls_active = True
-        self._memo_text_edit.setPlainText(text)
-        self._memo_font_spin.setValue(normalized_size)
-        self._memo_controls_active = False
+        # 送信待ちの入力は捨てずに、表示を差し替える前に通知しておく。
+        self._flush_memo_text()
+        self._memo_emit_timer.stop()
+        # プログラムからの反映ではスロット自体を呼ばせないよう、シグナルを遮断して書き換える。
+        if self._memo_text_edit is not None:
+            with QSignalBlocker(self._memo_text_edit):
+                self._memo_text_edit.setPlainText(text)
+        self._memo_plain = text
+        with QSignalBlocker(self._memo_font_spin):
+            self._memo_font_spin.setValue(normalized_size)
         self._set_memo_enabled(True)
 
     def clear_memo(self) -> None:
         """メモ編集欄をリセットする。"""
 
-        self._memo_controls_active = True
-        self._memo_text_edit.clear()
-        self._memo_font_spin.setValue(self._memo_font_default)
-        self._memo_controls_active = False
+        # 送信待ちの入力は捨てずに、表示を差し替える前に通知しておく。
+        self._flush_memo_text()
+        self._memo_emit_timer.stop()
+        if self._memo_text_edit is not None:
+            with QSignalBlocker(self._memo_text_edit):
+                self._memo_text_edit.clear()
+        self._memo_plain = ""
+        with QSignalBlocker(self._memo_font_spin):
+            self._memo_font_spin.setValue(self._memo_font_default)
         self._set_memo_enabled(False)
 
+    def flush_memo_text(self) -> None:
+        """保留中のメモ変更があれば直ちに通知する。
+
+        選択ノードの切り替えや保存の前に呼び、入力途中の内容を取りこぼさないようにする。
+        """
+
+        if self._memo_emit_timer.isActive():
+            self._memo_emit_timer.stop()
+            self._flush_memo_text()
+
     def _set_memo_enabled(self, enabled: bool) -> None:
-        self._memo_text_edit.setEnabled(enabled)
+        self._memo_enabled = enabled
+        if self._memo_text_edit is not None:
+            self._memo_text_edit.setEnabled(enabled)
         self._memo_font_spin.setEnabled(enabled)
 
     def show_properties(self, properties: Iterable[Tuple[str, str]]) -> None:
         """ノードのプロパティ一覧を表示する。"""
 
-        lines = [f"{name}: {value}" for name, value in properties]
-        self._property_plain_text.setPlainText("\n".join(lines))
+        self._populate_property_rows(list(properties))
 
     def clear_properties(self) -> None:
         """プロパティ表示をリセットする。"""
 
-        self._property_plain_text.clear()
-        self.set_tool_launch_state(enabled=False, label="-", visible=False)
+        self._populate_property_rows(_PLACEHOLDER_ROWS)
+        self.set_tool_launch_state(enabled=False, label=_DASH, visible=False)
+
+    def _populate_property_rows(self, rows: Sequence[Tuple[str, str]]) -> None:
+        table = self._property_table
+        table.setUpdatesEnabled(False)
+        try:
+            if self._property_model.set_rows(rows):
+                table.resizeColumnToContents(0)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def set_tool_launch_state(
         self,
@@ -233,7 +406,7 @@ class NodeInspectorPanel(QWidget):
     ) -> None:
         """ツール起動ボタンの状態を更新する。"""
 
-        display = label.strip() if label and label.strip() else "-"
+        display = label.strip() if label and label.strip() else _DASH
         self._tool_launch_label.setText(f"起動対象: {display}")
         self._tool_launch_button.setEnabled(enabled)
         self._tool_launch_label.setVisible(visible)
@@ -251,31 +424,42 @@ class NodeInspectorPanel(QWidget):
         self.tool_launch_requested.emit()
 
     def _on_memo_text_changed(self) -> None:
-        if self._memo_controls_active:
+        self._memo_emit_timer.start()
+
+    def _flush_memo_text(self) -> None:
+        if self._memo_text_edit is None:
+            return
+        text = self._memo_text_edit.toPlainText()
+        if text == self._memo_plain:
             return
-        self.memo_text_changed.emit(self._memo_text_edit.toPlainText())
+        self._memo_plain = text
+        self.memo_text_changed.emit(text)
 
     def _on_memo_font_changed(self, value: int) -> None:
-        if self._memo_controls_active:
-            return
-        self.memo_font_changed.emit(self._normalize_font_size(value))
+        # QSpinBox は _memo_font_range と同じ範囲へ既に丸めた int を渡すため、
+        # 正規化を挟まずそのまま転送する。
+        self.memo_font_changed.emit(value)
 
     def _normalize_font_size(self, value: int) -> int:
-        minimum, maximum = self._memo_font_range
-        try:
-            coerced = int(value)
-        except (TypeError, ValueError):
-            return self._memo_font_default
-        return max(minimum, min(maximum, coerced))
+        if type(value) is int:
+            coerced = value
+        else:
+            try:
+                coerced = int(value)
+            except (TypeError, ValueError):
+                return self._memo_font_default
+        if coerced < self._memo_font_min:
+            return self._memo_font_min
+        if coerced > self._memo_font_max:
+            return self._memo_font_max
+        return coerced
 
 
 class NodeInspectorDock(QDockWidget):
-    """ノードインスペクタ用ドックウィジェット。"""
+    """ノードインスペクタ用ドックウィジェット。
 
-    rename_requested = Signal(str)
-    memo_text_changed = Signal(str)
-    memo_font_changed = Signal(int)
-    tool_launch_requested = Signal()
+    公開シグナルは内部パネルのシグナルをそのまま参照しており、転送を挟まない。
+    """
 
     def __init__(
         self,
@@ -298,15 +482,15 @@ class NodeInspectorDock(QDockWidget):
             memo_font_range=memo_font_range,
             memo_font_default=memo_font_default,
         )
-        panel.rename_requested.connect(self.rename_requested)
-        panel.memo_text_changed.connect(self.memo_text_changed)
-        panel.memo_font_changed.connect(self.memo_font_changed)
-        panel.tool_launch_requested.connect(self.tool_launch_requested)
+        self.rename_requested = panel.rename_requested
+        self.memo_text_changed = panel.memo_text_changed
+        self.memo_font_changed = panel.memo_font_changed
+        self.tool_launch_requested = panel.tool_launch_requested
 
         container = QWidget(self)
         container.setObjectName("dockContentContainer")
         layout = QVBoxLayout(container)
-        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setContentsMargins(*_DOCK_MARGINS)
         layout.setSpacing(12)
         layout.addWidget(panel)
         self.setWidget(container)
@@ -322,7 +506,7 @@ class NodeInspectorDock(QDockWidget):
         self,
         *,
         name: str,
-        node_type: object,
+        node_type: str,
         node_uuid: str,
         position_text: str,
         children_text: str,
@@ -350,6 +534,9 @@ class NodeInspectorDock(QDockWidget):
     def clear_memo(self) -> None:
         self._panel.clear_memo()
 
+    def flush_memo_text(self) -> None:
+        self._panel.flush_memo_text()
+
     def show_properties(self, properties: Iterable[Tuple[str, str]]) -> None:
         self._panel.show_properties(properties)
 
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import shutil
-import uuid
 from dataclasses import dataclass
 from pathlib import Path
+from collections import Counter
 from collections.abc import Iterable as IterableABC, Mapping
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from qtpy import QtCore, QtGui, QtWidgets
 
@@ -19,6 +22,7 @@ from sotugyo.qt_compat import ensure_qt_module_alias
 QPoint = QtCore.QPoint
 Qt = QtCore.Qt
 Signal = QtCore.Signal
+Slot = QtCore.Slot
 QAction = QtGui.QAction
 QCloseEvent = QtGui.QCloseEvent
 QKeySequence = QtGui.QKeySequence
@@ -84,6 +88,46 @@ from ..docks.inspector import NodeInspectorDock
 from ..toolbars.timeline_alignment import TimelineAlignmentToolBar
 from sotugyo.infrastructure.paths.storage import get_rez_package_dir
 
+# NodeGraphQt のバージョン差で名前が異なるシグナルは、ウィンドウ生成ごとに
+# 探索せずモジュール読み込み時に一度だけ解決しておく。
+_GRAPH_SELECTION_SIGNAL: Optional[str] = next(
+    (
+        name
+        for name in ("selection_changed", "node_selection_changed")
+        if isinstance(getattr(NodeGraph, name, None), Signal)
+    ),
+    None,
+)
+_GRAPH_CONNECTION_SIGNALS: Tuple[str, ...] = tuple(
+    name
+    for name in ("port_connected", "port_disconnected", "pipes_deleted")
+    if isinstance(getattr(NodeGraph, name, None), Signal)
+)
+_GRAPH_NODE_SET_SIGNALS: Tuple[str, ...] = tuple(
+    name
+    for name in ("node_created", "nodes_deleted")
+    if isinstance(getattr(NodeGraph, name, None), Signal)
+)
+_GRAPH_PROPERTY_SIGNAL: Optional[str] = (
+    "property_changed"
+    if isinstance(getattr(NodeGraph, "property_changed", None), Signal)
+    else None
+)
+
+
+def _new_uuid_text() -> str:
+    """UUID4 文字列を生成する。
+
+    ``str(uuid.uuid4())`` と同じ形式だが、UUID オブジェクトを経由せず
+    乱数バイト列から直接整形するため、読み込み時の大量採番で負荷が小さい。
+    """
+
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    digits = raw.hex()
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
 
 @dataclass
 class NodeSnapSettings:
@@ -105,6 +149,49 @@ class NodeEditorWindow(QMainWindow):
     WINDOW_TITLE = "ノード編集テスト"
     return_to_start_requested = Signal()
 
+    # メニュー構成（None は区切り線）。各項目は (表示名, スロット名, ショートカット)。
+    _MENU_SPECS: Tuple[Tuple[str, Tuple[Optional[Tuple[str, str, object]], ...]], ...] = (
+        (
+            "File",
+            (
+                ("上書き保存", "_file_save", QKeySequence.Save),
+                ("選択ノードを保存...", "_file_export_selected_nodes", None),
+                ("アセットをインポート...", "_file_import", QKeySequence.Open),
+                None,
+                ("スタート画面に戻る", "_return_to_start", None),
+            ),
+        ),
+        ("ProjectSetting", (("プロジェクト設定...", "_open_project_settings", None),)),
+        ("UserSetting", (("ユーザー設定...", "_open_user_settings", None),)),
+        (
+            "Tools",
+            (
+                ("ツールの確認と編集...", "_open_tool_settings", None),
+                ("起動環境の構成...", "_open_tool_environment_settings", None),
+                ("プラグインの管理...", "_open_plugin_manager", None),
+            ),
+        ),
+    )
+    # プロジェクト読み込み時に既存ノード数から連番を数え直す種別。
+    _RECOUNTED_NODE_TYPES: Tuple[str, ...] = (
+        "sotugyo.demo.TaskNode",
+        "sotugyo.demo.ReviewNode",
+        MemoNode.node_type_identifier(),
+    )
+    # ショートカット定義。各項目は (キーシーケンス, スロット名, グラフ限定か)。
+    # ノード編集系はグラフビューにフォーカスがある間だけ有効にし、
+    # メモ欄など他のウィジェットでのキー入力と衝突させない。
+    _SHORTCUT_SPECS: Tuple[Tuple[str, str, bool], ...] = (
+        ("Delete", "_delete_selected_nodes", True),
+        ("Ctrl+S", "_file_save", False),
+        ("Ctrl+O", "_file_import", False),
+        ("Ctrl+F", "_focus_content_browser_search", False),
+        ("Ctrl+Shift+C", "_connect_selected_nodes", True),
+        ("Ctrl+Shift+D", "_disconnect_selected_nodes", True),
+        ("Ctrl+T", "_create_task_node", True),
+        ("Ctrl+R", "_create_review_node", True),
+    )
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -118,6 +205,19 @@ class NodeEditorWindow(QMainWindow):
         self.resize(960, 600)
 
         self._graph = NodeGraph()
+        # NodeGraphQt のバージョン差異は起動時に一度だけ判定しておく。
+        self._connect_ports_impl = self._resolve_graph_port_api(
+            "connect_ports", self._connect_ports_fallback
+        )
+        self._disconnect_ports_impl = self._resolve_graph_port_api(
+            "disconnect_ports", self._disconnect_ports_fallback
+        )
+        self._graph_clear_selection: Callable[[], None] = self._resolve_graph_method(
+            "clear_selection"
+        ) or (lambda: None)
+        self._graph_all_nodes = self._resolve_graph_method("all_nodes")
+        self._graph_nodes = self._resolve_graph_method("nodes")
+        self._graph_selected_nodes = self._resolve_graph_method("selected_nodes")
         self._snap_settings = NodeSnapSettings()
         self._snap_action: QAction | None = None
 
@@ -137,19 +237,41 @@ class NodeEditorWindow(QMainWindow):
         self._configure_graph_drag_drop()
 
         self._node_spawn_offset = 0
-        self._task_count = 0
-        self._review_count = 0
-        self._memo_count = 0
-        self._date_count = 0
+        # ノード種別ごとの生成連番。表示名の末尾に付ける。
+        self._create_counters: Dict[str, int] = {}
         self._current_node = None
         self._known_nodes: List = []
-        self._node_metadata: Dict[object, Dict[str, str]] = {}
+        # グラフ上の全ノード一覧。ノードの追加・削除で破棄する。
+        self._all_nodes_cache: Optional[List] = None
+        # 接続の走査中だけ使う (id(ノード), 出力側か) -> ポート一覧。走査外では None。
+        self._port_cache: Optional[Dict[Tuple[int, bool], List[Port]]] = None
+        # 同じ期間だけ使う (id(ノード), 出力側か) -> {id(ポート): 番号}。
+        self._port_index_cache: Optional[Dict[Tuple[int, bool], Dict[int, int]]] = None
+        # 検索用の (小文字化したノード名, ノード) 一覧。ノードの増減と改名で破棄する。
+        self._name_index: Optional[List[Tuple[str, object]]] = None
+        # 削除漏れがあってもノード（とそのグラフィックス項目）を保持し続けないよう弱参照で持つ。
+        self._node_metadata: "WeakKeyDictionary[object, Tuple[str, str]]" = WeakKeyDictionary()
+        # UUID からノードを引く逆引き表。_node_metadata と対で更新する。
+        # 大文字小文字を区別せずに引けるよう、キーは小文字化した UUID とする。
+        self._node_by_uuid: "WeakValueDictionary[str, object]" = WeakValueDictionary()
+        # ノードの種別 ID は生成後に変わらないため、ノードごとに保持する。
+        self._type_id_cache: "WeakKeyDictionary[object, str]" = WeakKeyDictionary()
+        # メモノードごとの現在のメモ本文。入力の度にノードへ問い合わせずに比較する。
+        self._memo_text_shadow: "WeakKeyDictionary[object, object]" = WeakKeyDictionary()
+        # 保存用に正規化したカスタムプロパティ。プロパティが変わったノードの分だけ破棄する。
+        self._custom_props_cache: "WeakKeyDictionary[object, Dict[str, object]]" = (
+            WeakKeyDictionary()
+        )
         self._is_modified = False
         self._current_project_root: Optional[Path] = None
         self._current_project_settings: Optional[ProjectSettings] = None
         self._current_user: Optional[UserAccount] = None
         self._current_user_password: Optional[str] = None
         self._is_updating_selection = False
+        self._message_boxes: Dict[str, QMessageBox] = {}
+        # 表示中のノード詳細が古くなっている可能性があるか。選択が同じノードのままなら
+        # この値が偽の間は詳細の再構築を省略する。
+        self._node_details_stale = True
         self._coordinator = NodeEditorCoordinator(
             project_service=project_service,
             user_manager=user_manager,
@@ -161,6 +283,8 @@ class NodeEditorWindow(QMainWindow):
         self._tool_environments: Dict[str, ToolEnvironmentDefinition] = {}
         self._local_rez_packages: Dict[str, RezPackageSpec] = {}
         self._project_rez_packages: Dict[str, RezPackageSpec] = {}
+        # ツール構成が変わるまではカタログ内容も変わらないため、生成結果を使い回す。
+        self._catalog_entries_cache: Optional[List[NodeCatalogEntry]] = None
 
         self._shortcuts: List[QShortcut] = []
         self._node_type_creators = {
@@ -262,48 +386,18 @@ class NodeEditorWindow(QMainWindow):
     def _create_menus(self) -> None:
         menubar = self.menuBar()
 
-        file_menu = menubar.addMenu("File")
-
-        save_action = QAction("上書き保存", self)
-        save_action.triggered.connect(self._file_save)
-        save_action.setShortcut(QKeySequence.Save)
-        file_menu.addAction(save_action)
-
-        export_selected_action = QAction("選択ノードを保存...", self)
-        export_selected_action.triggered.connect(self._file_export_selected_nodes)
-        file_menu.addAction(export_selected_action)
-
-        import_action = QAction("アセットをインポート...", self)
-        import_action.triggered.connect(self._file_import)
-        import_action.setShortcut(QKeySequence.Open)
-        file_menu.addAction(import_action)
-
-        file_menu.addSeparator()
-
-        return_action = QAction("スタート画面に戻る", self)
-        return_action.triggered.connect(self._return_to_start)
-        file_menu.addAction(return_action)
-
-        project_menu = menubar.addMenu("ProjectSetting")
-        project_settings_action = QAction("プロジェクト設定...", self)
-        project_settings_action.triggered.connect(self._open_project_settings)
-        project_menu.addAction(project_settings_action)
-
-        user_menu = menubar.addMenu("UserSetting")
-        user_settings_action = QAction("ユーザー設定...", self)
-        user_settings_action.triggered.connect(self._open_user_settings)
-        user_menu.addAction(user_settings_action)
-
-        tools_menu = menubar.addMenu("Tools")
-        tool_registry_action = QAction("ツールの確認と編集...", self)
-        tool_registry_action.triggered.connect(self._open_tool_settings)
-        tools_menu.addAction(tool_registry_action)
-        tool_environment_action = QAction("起動環境の構成...", self)
-        tool_environment_action.triggered.connect(self._open_tool_environment_settings)
-        tools_menu.addAction(tool_environment_action)
-        plugin_manager_action = QAction("プラグインの管理...", self)
-        plugin_manager_action.triggered.connect(self._open_plugin_manager)
-        tools_menu.addAction(plugin_manager_action)
+        for menu_title, action_specs in self._MENU_SPECS:
+            menu = menubar.addMenu(menu_title)
+            for spec in action_specs:
+                if spec is None:
+                    menu.addSeparator()
+                    continue
+                label, slot_name, shortcut = spec
+                action = QAction(label, self)
+                action.triggered.connect(getattr(self, slot_name))
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                menu.addAction(action)
 
         view_menu = menubar.addMenu("View")
         if self._inspector_dock is not None:
@@ -383,22 +477,17 @@ class NodeEditorWindow(QMainWindow):
         self._show_info_dialog("プラグインの管理は準備中です。")
 
     def _setup_graph_signals(self) -> None:
-        selection_signal = getattr(self._graph, "selection_changed", None)
-        if selection_signal is not None and hasattr(selection_signal, "connect"):
-            selection_signal.connect(self._on_selection_changed)
-        else:
-            selection_signal = getattr(self._graph, "node_selection_changed", None)
-            if selection_signal is not None and hasattr(selection_signal, "connect"):
-                selection_signal.connect(self._on_selection_changed)
-
-        connection_signals = [
-            getattr(self._graph, "port_connected", None),
-            getattr(self._graph, "port_disconnected", None),
-            getattr(self._graph, "pipes_deleted", None),
-        ]
-        for signal in connection_signals:
-            if signal is not None and hasattr(signal, "connect"):
-                signal.connect(self._on_port_connection_changed)
+        if _GRAPH_SELECTION_SIGNAL is not None:
+            getattr(self._graph, _GRAPH_SELECTION_SIGNAL).connect(self._on_selection_changed)
+
+        for signal_name in _GRAPH_CONNECTION_SIGNALS:
+            getattr(self._graph, signal_name).connect(self._on_port_connection_changed)
+
+        # 取り消し操作などグラフ側で行われた追加・削除でもノード一覧を取り直す。
+        for signal_name in _GRAPH_NODE_SET_SIGNALS:
+            getattr(self._graph, signal_name).connect(self._invalidate_all_nodes_cache)
+        if _GRAPH_PROPERTY_SIGNAL is not None:
+            getattr(self._graph, _GRAPH_PROPERTY_SIGNAL).connect(self._on_node_property_changed)
 
         viewer_getter = getattr(self._graph, "viewer", None)
         viewer = viewer_getter() if callable(viewer_getter) else None
@@ -414,6 +503,45 @@ class NodeEditorWindow(QMainWindow):
             moved_signal.connect(self._handle_nodes_moved)
 
     def _setup_context_menu(self) -> None:
+        # 右クリックの度に作り直さず、メニューは一度だけ構築して使い回す。
+        menu = QMenu(self)
+        self._context_menu_nodes: List = []
+
+        add_task_action = menu.addAction("タスクノードを追加")
+        add_task_action.triggered.connect(lambda: self._create_task_node())
+
+        add_review_action = menu.addAction("レビューノードを追加")
+        add_review_action.triggered.connect(lambda: self._create_review_node())
+
+        add_memo_action = menu.addAction("メモノードを追加")
+        add_memo_action.triggered.connect(lambda: self._create_memo_node())
+
+        add_date_action = menu.addAction("日付ノードを追加")
+        add_date_action.triggered.connect(lambda: self._create_date_node())
+
+        menu.addSeparator()
+
+        self._ctx_delete_action = menu.addAction("選択ノードを削除")
+        self._ctx_delete_action.triggered.connect(
+            lambda: self._delete_selected_nodes(nodes=self._context_menu_nodes)
+        )
+
+        self._ctx_connect_action = menu.addAction("選択ノードを接続")
+        self._ctx_connect_action.triggered.connect(
+            lambda: self._connect_selected_nodes(nodes=self._context_menu_nodes)
+        )
+
+        self._ctx_disconnect_action = menu.addAction("選択ノードを切断")
+        self._ctx_disconnect_action.triggered.connect(
+            lambda: self._disconnect_selected_nodes(nodes=self._context_menu_nodes)
+        )
+
+        menu.addSeparator()
+
+        search_action = menu.addAction("ノード検索を開く")
+        search_action.triggered.connect(lambda: self._focus_content_browser_search())
+        self._graph_context_menu = menu
+
         if hasattr(self._graph_widget, "setContextMenuPolicy"):
             self._graph_widget.setContextMenuPolicy(Qt.CustomContextMenu)
             self._graph_widget.customContextMenuRequested.connect(
@@ -422,22 +550,19 @@ class NodeEditorWindow(QMainWindow):
 
     def _setup_shortcuts(self) -> None:
         self._shortcuts.clear()
-
-        def register(sequence: QKeySequence | str, callback) -> None:
-            shortcut = QShortcut(QKeySequence(sequence), self)
-            shortcut.setContext(Qt.WidgetWithChildrenShortcut)
-            shortcut.activated.connect(callback)
+        # フォーカスを受け取るのはタブ内のビューアーなので、グラフ限定の
+        # ショートカットはビューアー自身に WidgetShortcut で登録する。
+        viewer = self._graph.viewer()
+        for sequence, slot_name, graph_only in self._SHORTCUT_SPECS:
+            if graph_only:
+                shortcut = QShortcut(QKeySequence(sequence), viewer)
+                shortcut.setContext(Qt.WidgetShortcut)
+            else:
+                shortcut = QShortcut(QKeySequence(sequence), self)
+                shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(getattr(self, slot_name))
             self._shortcuts.append(shortcut)
 
-        register("Delete", self._delete_selected_nodes)
-        register("Ctrl+S", self._file_save)
-        register("Ctrl+O", self._file_import)
-        register("Ctrl+F", self._focus_content_browser_search)
-        register("Ctrl+Shift+C", self._connect_selected_nodes)
-        register("Ctrl+Shift+D", self._disconnect_selected_nodes)
-        register("Ctrl+T", self._create_task_node)
-        register("Ctrl+R", self._create_review_node)
-
     def _initialize_content_browser(self) -> None:
         if self._content_dock is None:
             return
@@ -445,29 +570,37 @@ class NodeEditorWindow(QMainWindow):
 
     def _refresh_tool_configuration(self) -> None:
         snapshot = self._coordinator.load_tool_snapshot()
+        tools = dict(snapshot.tools)
+        environments = dict(snapshot.environments)
+        # ダイアログで保存されても内容が同じならカタログは作り直さない。
+        if tools != self._registered_tools or environments != self._tool_environments:
+            self._catalog_entries_cache = None
         self._tool_snapshot = snapshot
-        self._registered_tools = dict(snapshot.tools)
-        self._tool_environments = dict(snapshot.environments)
+        self._registered_tools = tools
+        self._tool_environments = environments
         self._load_local_rez_packages()
         self._refresh_content_browser_entries()
 
     def _refresh_content_browser_entries(self) -> None:
         if self._content_dock is None:
             return
-        records = self._build_available_node_records()
-        if self._tool_snapshot is not None:
-            records = self._coordinator.extend_catalog(records, self._tool_snapshot)
-        entries = [
-            NodeCatalogEntry(
-                node_type=record.node_type,
-                title=record.title,
-                subtitle=record.subtitle,
-                genre=record.genre,
-                keywords=record.keywords,
-                icon_path=record.icon_path,
-            )
-            for record in records
-        ]
+        entries = self._catalog_entries_cache
+        if entries is None:
+            records = self._build_available_node_records()
+            if self._tool_snapshot is not None:
+                records = self._coordinator.extend_catalog(records, self._tool_snapshot)
+            entries = [
+                NodeCatalogEntry(
+                    node_type=record.node_type,
+                    title=record.title,
+                    subtitle=record.subtitle,
+                    genre=record.genre,
+                    keywords=record.keywords,
+                    icon_path=record.icon_path,
+                )
+                for record in records
+            ]
+            self._catalog_entries_cache = entries
         self._content_dock.set_catalog_entries(entries)
 
     def _load_project_rez_packages(self) -> None:
@@ -582,49 +715,26 @@ class NodeEditorWindow(QMainWindow):
         ]
         return records
 
+    @Slot(QPoint)
     def _open_graph_context_menu(self, position: QPoint) -> None:
-        menu = QMenu(self)
-
-        add_task_action = menu.addAction("タスクノードを追加")
-        add_task_action.triggered.connect(self._create_task_node)
-
-        add_review_action = menu.addAction("レビューノードを追加")
-        add_review_action.triggered.connect(self._create_review_node)
-
-        add_memo_action = menu.addAction("メモノードを追加")
-        add_memo_action.triggered.connect(self._create_memo_node)
-
-        add_date_action = menu.addAction("日付ノードを追加")
-        add_date_action.triggered.connect(self._create_date_node)
-
-        menu.addSeparator()
-
-        delete_action = menu.addAction("選択ノードを削除")
-        delete_action.triggered.connect(self._delete_selected_nodes)
-
-        connect_action = menu.addAction("選択ノードを接続")
-        connect_action.triggered.connect(self._connect_selected_nodes)
-
-        disconnect_action = menu.addAction("選択ノードを切断")
-        disconnect_action.triggered.connect(self._disconnect_selected_nodes)
-
-        menu.addSeparator()
-
-        search_action = menu.addAction("ノード検索を開く")
-        search_action.triggered.connect(self._focus_content_browser_search)
-
-        selected_nodes = self._graph.selected_nodes()
-        delete_action.setEnabled(bool(selected_nodes))
-        connect_action.setEnabled(len(selected_nodes) == 2)
-        disconnect_action.setEnabled(len(selected_nodes) == 2)
+        # メニュー表示中は選択が変わらないため、選択ノードは一度だけ取得して各操作へ渡す。
+        selected_nodes = self._graph_selected_nodes()
+        self._context_menu_nodes = selected_nodes
+        self._ctx_delete_action.setEnabled(bool(selected_nodes))
+        self._ctx_connect_action.setEnabled(len(selected_nodes) == 2)
+        self._ctx_disconnect_action.setEnabled(len(selected_nodes) == 2)
 
         global_pos = self._graph_widget.mapToGlobal(position)
-        menu.exec(global_pos)
+        try:
+            self._graph_context_menu.exec(global_pos)
+        finally:
+            self._context_menu_nodes = []
 
     def _focus_content_browser_search(self) -> None:
         if self._content_dock is not None:
             self._content_dock.focus_search()
 
+    @Slot(str)
     def _handle_content_browser_search(self, keyword: str) -> None:
         if self._content_dock is None:
             return
@@ -643,6 +753,7 @@ class NodeEditorWindow(QMainWindow):
 
         self._show_info_dialog(f"「{keyword}」に一致するノードが見つかりません。")
 
+    @Slot(str)
     def _spawn_node_by_type(self, node_type: str) -> None:
         self._spawn_node_by_type_at(node_type, position=None)
 
@@ -652,14 +763,15 @@ class NodeEditorWindow(QMainWindow):
         *,
         position: QtCore.QPointF | None,
     ) -> None:
-        if node_type.startswith("tool-environment:"):
-            environment_id = node_type.split(":", 1)[1]
-            self._create_tool_environment_node(environment_id, position=position)
-            return
+        # 組み込みノードは辞書引き 1 回で確定させ、接頭辞の判定はその後に行う。
         creator = self._node_type_creators.get(node_type)
         if creator is not None:
             creator(position=position)
             return
+        if node_type.startswith("tool-environment:"):
+            environment_id = node_type.split(":", 1)[1]
+            self._create_tool_environment_node(environment_id, position=position)
+            return
         display_name = self._derive_display_name(node_type)
         self._create_node(node_type, display_name, position=position)
 
@@ -677,9 +789,15 @@ class NodeEditorWindow(QMainWindow):
         uuid_value: Optional[str] = None,
         assigned_at: Optional[str] = None,
     ) -> Tuple[str, str, bool]:
+        # ノードごとの (uuid, 採番日) をタプルで保持し、内側の辞書生成と再検索を避ける。
         metadata = self._node_metadata.get(node)
-        existing_uuid = metadata.get("uuid") if metadata else None
-        existing_assigned_at = metadata.get("uuid_assigned_at") if metadata else None
+        # 保持する値は常に空でないため、上書き指定が無ければそのまま返せる。
+        if metadata is not None and uuid_value is None and assigned_at is None:
+            return metadata[0], metadata[1], False
+        if metadata is not None:
+            existing_uuid, existing_assigned_at = metadata
+        else:
+            existing_uuid = existing_assigned_at = None
 
         provided_uuid = uuid_value.strip() if isinstance(uuid_value, str) else None
         uuid_was_missing = False
@@ -688,7 +806,7 @@ class NodeEditorWindow(QMainWindow):
         elif existing_uuid:
             normalized_uuid = existing_uuid
         else:
-            normalized_uuid = str(uuid.uuid4())
+            normalized_uuid = _new_uuid_text()
             uuid_was_missing = True
 
         provided_assigned_at = assigned_at.strip() if isinstance(assigned_at, str) else None
@@ -701,62 +819,62 @@ class NodeEditorWindow(QMainWindow):
             normalized_assigned_at = datetime.now().strftime("%Y-%m-%d")
             assigned_at_was_missing = True
 
-        previous_uuid = metadata.get("uuid") if metadata else None
-        previous_assigned_at = metadata.get("uuid_assigned_at") if metadata else None
-        if (
-            metadata is None
-            or previous_uuid != normalized_uuid
-            or previous_assigned_at != normalized_assigned_at
-        ):
-            self._node_metadata[node] = {
-                "uuid": normalized_uuid,
-                "uuid_assigned_at": normalized_assigned_at,
-            }
+        values_differ = (
+            existing_uuid != normalized_uuid
+            or existing_assigned_at != normalized_assigned_at
+        )
+        if metadata is None or values_differ:
+            self._node_metadata[node] = (normalized_uuid, normalized_assigned_at)
+            if existing_uuid and existing_uuid != normalized_uuid:
+                self._discard_node_uuid(existing_uuid, node)
+            self._node_by_uuid[normalized_uuid.lower()] = node
 
         metadata_changed = uuid_was_missing or assigned_at_was_missing
         if not metadata_changed and metadata is not None:
-            metadata_changed = (
-                previous_uuid != normalized_uuid
-                or previous_assigned_at != normalized_assigned_at
-            )
+            metadata_changed = values_differ
 
         return normalized_uuid, normalized_assigned_at, metadata_changed
 
+    def _discard_node_uuid(self, node_uuid: str, node) -> None:
+        # 同じ UUID を別ノードが引き継いでいる場合は、その対応を残す。
+        key = node_uuid.lower()
+        if self._node_by_uuid.get(key) is node:
+            del self._node_by_uuid[key]
+
     def _remove_node_metadata(self, nodes: Iterable) -> None:
         for node in nodes:
-            self._node_metadata.pop(node, None)
+            metadata = self._node_metadata.pop(node, None)
+            if metadata is not None:
+                self._discard_node_uuid(metadata[0], node)
+            self._custom_props_cache.pop(node, None)
+            self._type_id_cache.pop(node, None)
+
+    def _create_counted_node(
+        self,
+        node_type: str,
+        prefix: str,
+        *,
+        position: QtCore.QPointF | None = None,
+    ) -> None:
+        count = self._create_counters.get(node_type, 0) + 1
+        self._create_counters[node_type] = count
+        self._create_node(node_type, f"{prefix} {count}", position=position)
+
+    def _reset_create_counters(self) -> None:
+        for node_type in self._RECOUNTED_NODE_TYPES:
+            self._create_counters[node_type] = 0
 
     def _create_task_node(self, *, position: QtCore.QPointF | None = None) -> None:
-        self._task_count += 1
-        self._create_node(
-            "sotugyo.demo.TaskNode",
-            f"タスク {self._task_count}",
-            position=position,
-        )
+        self._create_counted_node("sotugyo.demo.TaskNode", "タスク", position=position)
 
     def _create_review_node(self, *, position: QtCore.QPointF | None = None) -> None:
-        self._review_count += 1
-        self._create_node(
-            "sotugyo.demo.ReviewNode",
-            f"レビュー {self._review_count}",
-            position=position,
-        )
+        self._create_counted_node("sotugyo.demo.ReviewNode", "レビュー", position=position)
 
     def _create_memo_node(self, *, position: QtCore.QPointF | None = None) -> None:
-        self._memo_count += 1
-        self._create_node(
-            MemoNode.node_type_identifier(),
-            f"メモ {self._memo_count}",
-            position=position,
-        )
+        self._create_counted_node(MemoNode.node_type_identifier(), "メモ", position=position)
 
     def _create_date_node(self, *, position: QtCore.QPointF | None = None) -> None:
-        self._date_count += 1
-        self._create_node(
-            DateNode.node_type_identifier(),
-            f"日付 {self._date_count}",
-            position=position,
-        )
+        self._create_counted_node(DateNode.node_type_identifier(), "日付", position=position)
 
     def _create_asset_node(self, asset_name: str) -> None:
         title = asset_name.strip() or "アセット"
@@ -851,25 +969,27 @@ class NodeEditorWindow(QMainWindow):
             node.set_snap_grid_size(self._snap_settings.grid_size)
         self._node_spawn_offset += 1
         self._known_nodes.append(node)
+        self._invalidate_all_nodes_cache()
         self._ensure_node_metadata(node)
         self._set_modified(True)
 
-        clear_selection = getattr(self._graph, "clear_selection", None)
-        if callable(clear_selection):
-            clear_selection()
+        self._graph_clear_selection()
         if hasattr(node, "set_selected"):
             node.set_selected(True)
         self._on_selection_changed()
         self._refresh_node_catalog()
         return node
 
-    def _delete_selected_nodes(self) -> None:
-        nodes = self._graph.selected_nodes()
+    def _delete_selected_nodes(self, *, nodes: Optional[List] = None) -> None:
+        if nodes is None:
+            nodes = self._graph_selected_nodes()
         if not nodes:
             self._show_info_dialog("削除するノードを選択してください。")
             return
         self._graph.delete_nodes(nodes)
-        self._known_nodes = [node for node in self._known_nodes if node not in nodes]
+        removed = set(nodes)
+        self._known_nodes = [node for node in self._known_nodes if node not in removed]
+        self._invalidate_all_nodes_cache()
         self._remove_node_metadata(nodes)
         self._on_selection_changed()
         self._set_modified(True)
@@ -878,18 +998,36 @@ class NodeEditorWindow(QMainWindow):
     # ------------------------------------------------------------------
     # 接続処理
     # ------------------------------------------------------------------
+    def _resolve_graph_method(self, name: str) -> Optional[Callable]:
+        method = getattr(self._graph, name, None)
+        return method if callable(method) else None
+
+    def _resolve_graph_port_api(
+        self,
+        name: str,
+        fallback: Callable[[Port, Port], None],
+    ) -> Callable[[Port, Port], None]:
+        return self._resolve_graph_method(name) or fallback
+
+    @staticmethod
+    def _connect_ports_fallback(source_port: Port, target_port: Port) -> None:
+        connect_to = getattr(source_port, "connect_to", None)
+        if not callable(connect_to):  # pragma: no cover - 保険的分岐
+            raise AttributeError("connect_ports API が利用できません")
+        connect_to(target_port)
+
+    @staticmethod
+    def _disconnect_ports_fallback(source_port: Port, target_port: Port) -> None:
+        disconnect_from = getattr(source_port, "disconnect_from", None)
+        if not callable(disconnect_from):  # pragma: no cover - 保険的分岐
+            raise AttributeError("disconnect_ports API が利用できません")
+        disconnect_from(target_port)
+
     def _connect_ports_compat(self, source_port: Port, target_port: Port) -> None:
         """NodeGraphQt のバージョン差異を吸収してポートを接続する。"""
 
-        connect_ports = getattr(self._graph, "connect_ports", None)
         try:
-            if callable(connect_ports):
-                connect_ports(source_port, target_port)
-            else:
-                fallback = getattr(source_port, "connect_to", None)
-                if not callable(fallback):  # pragma: no cover - 保険的分岐
-                    raise AttributeError("connect_ports API が利用できません")
-                fallback(target_port)
+            self._connect_ports_impl(source_port, target_port)
         except Exception as exc:  # pragma: no cover - Qt 依存の例外
             LOGGER.warning(
                 "ポート接続に失敗しました（source=%s, target=%s）: %s",
@@ -903,15 +1041,8 @@ class NodeEditorWindow(QMainWindow):
     def _disconnect_ports_compat(self, source_port: Port, target_port: Port) -> None:
         """NodeGraphQt のバージョン差異を吸収してポートを切断する。"""
 
-        disconnect_ports = getattr(self._graph, "disconnect_ports", None)
         try:
-            if callable(disconnect_ports):
-                disconnect_ports(source_port, target_port)
-            else:
-                fallback = getattr(source_port, "disconnect_from", None)
-                if not callable(fallback):  # pragma: no cover - 保険的分岐
-                    raise AttributeError("disconnect_ports API が利用できません")
-                fallback(target_port)
+            self._disconnect_ports_impl(source_port, target_port)
         except Exception as exc:  # pragma: no cover - Qt 依存の例外
             LOGGER.warning(
                 "ポート切断に失敗しました（source=%s, target=%s）: %s",
@@ -922,8 +1053,9 @@ class NodeEditorWindow(QMainWindow):
             )
             raise
 
-    def _connect_selected_nodes(self) -> None:
-        nodes = self._graph.selected_nodes()
+    def _connect_selected_nodes(self, *, nodes: Optional[List] = None) -> None:
+        if nodes is None:
+            nodes = self._graph_selected_nodes()
         if len(nodes) != 2:
             self._show_info_dialog("接続する 2 つのノードを選択してください。")
             return
@@ -937,8 +1069,9 @@ class NodeEditorWindow(QMainWindow):
         self._connect_ports_compat(source_port, target_port)
         self._set_modified(True)
 
-    def _disconnect_selected_nodes(self) -> None:
-        nodes = self._graph.selected_nodes()
+    def _disconnect_selected_nodes(self, *, nodes: Optional[List] = None) -> None:
+        if nodes is None:
+            nodes = self._graph_selected_nodes()
         if len(nodes) != 2:
             self._show_info_dialog("切断する 2 つのノードを選択してください。")
             return
@@ -950,22 +1083,24 @@ class NodeEditorWindow(QMainWindow):
             self._show_info_dialog("切断できるポートが見つかりませんでした。")
             return
 
-        disconnected = False
-        for connected_port in list(source_port.connected_ports()):
-            if connected_port.node() is target:
-                self._disconnect_ports_compat(source_port, connected_port)
-                disconnected = True
-                self._set_modified(True)
-        if not disconnected:
+        # 切断で接続一覧が変わるため、対象ノードへの接続だけを先に取り出しておく。
+        matches = [
+            connected_port
+            for connected_port in source_port.connected_ports()
+            if connected_port.node() is target
+        ]
+        if not matches:
             self._show_info_dialog("選択されたノード間に接続が存在しません。")
+            return
+        for connected_port in matches:
+            self._disconnect_ports_compat(source_port, connected_port)
+        self._set_modified(True)
 
     # ------------------------------------------------------------------
     # ユーティリティ
     # ------------------------------------------------------------------
     def _select_single_node(self, node) -> None:
-        clear_selection = getattr(self._graph, "clear_selection", None)
-        if callable(clear_selection):
-            clear_selection()
+        self._graph_clear_selection()
         if hasattr(node, "set_selected"):
             try:
                 node.set_selected(True)
@@ -1023,13 +1158,26 @@ class NodeEditorWindow(QMainWindow):
         return f"{node_label}:{repr(port)}"
 
     def _show_info_dialog(self, message: str) -> None:
-        QMessageBox.information(self, "操作案内", message)
+        self._show_message_box(QMessageBox.Information, "操作案内", message)
 
     def _show_warning_dialog(self, message: str) -> None:
-        QMessageBox.warning(self, "警告", message)
+        self._show_message_box(QMessageBox.Warning, "警告", message)
 
     def _show_error_dialog(self, message: str) -> None:
-        QMessageBox.critical(self, "エラー", message)
+        self._show_message_box(QMessageBox.Critical, "エラー", message)
+
+    def _show_message_box(self, icon, title: str, message: str) -> None:
+        # ダイアログは種別ごとに一度だけ生成して使い回す。表示中に同じ種別の
+        # 通知が重なった場合は、新しい画面を開かず本文へ追記する。
+        box = self._message_boxes.get(title)
+        if box is None:
+            box = QMessageBox(icon, title, "", QMessageBox.Ok, self)
+            self._message_boxes[title] = box
+        if box.isVisible():
+            box.setText(f"{box.text()}\n{message}")
+            return
+        box.setText(message)
+        box.exec()
 
     def _search_nodes(
         self, keyword: Optional[str] = None, *, show_dialog: bool = True
@@ -1047,33 +1195,68 @@ class NodeEditorWindow(QMainWindow):
             return None
 
         keyword_lower = keyword.lower()
-        matched = [
-            node
-            for node in self._collect_all_nodes()
-            if hasattr(node, "name") and keyword_lower in node.name().lower()
-        ]
-        if not matched:
+        # UUID がそのまま入力された場合は逆引き表から直接ノードを選ぶ。
+        node_by_uuid = self._node_by_uuid.get(keyword_lower)
+        if node_by_uuid is not None:
+            self._select_single_node(node_by_uuid)
+            return node_by_uuid
+        # 選択するのは最初の一致だけなので、見つかった時点で走査をやめる。
+        target = next(
+            (
+                node
+                for name_lower, node in self._node_name_index()
+                if keyword_lower in name_lower
+            ),
+            None,
+        )
+        if target is None:
             if show_dialog:
                 self._show_info_dialog(f"「{keyword}」に一致するノードが見つかりません。")
             return None
 
-        target = matched[0]
         self._select_single_node(target)
         return target
 
+    def _invalidate_all_nodes_cache(self, *_args, **_kwargs) -> None:
+        self._all_nodes_cache = None
+        self._name_index = None
+
+    def _on_node_property_changed(self, node, name, value=None, *_args) -> None:
+        self._node_details_stale = True
+        self._custom_props_cache.pop(node, None)
+        # ビュー上での直接編集も含め、改名されたら検索用の一覧を作り直す。
+        if name == "name":
+            self._name_index = None
+        elif name == "memo_text":
+            # 取り消し操作などでの変更もメモ本文の控えへ反映する。
+            self._memo_text_shadow[node] = value
+
+    def _node_name_index(self) -> List[Tuple[str, object]]:
+        if self._name_index is None:
+            self._name_index = [
+                (node.name().lower(), node)
+                for node in self._collect_all_nodes()
+                if hasattr(node, "name")
+            ]
+        return self._name_index
+
     def _collect_all_nodes(self) -> List:
+        # 保存時の Rez 集計と状態出力のように、1 回の操作で何度も呼ばれるため
+        # 一覧は保持しておき、呼び出し側には複製を渡す。
+        if self._all_nodes_cache is None:
+            self._all_nodes_cache = self._query_all_nodes()
+        return list(self._all_nodes_cache)
+
+    def _query_all_nodes(self) -> List:
         nodes: List = []
-        all_nodes = getattr(self._graph, "all_nodes", None)
-        if callable(all_nodes):
-            result = all_nodes()
+        if self._graph_all_nodes is not None:
+            result = self._graph_all_nodes()
+            if result is not None:
+                nodes = list(result)
+        if not nodes and self._graph_nodes is not None:
+            result = self._graph_nodes()
             if result is not None:
                 nodes = list(result)
-        if not nodes:
-            nodes_attr = getattr(self._graph, "nodes", None)
-            if callable(nodes_attr):
-                result = nodes_attr()
-                if result is not None:
-                    nodes = list(result)
         if not nodes:
             nodes = list(self._known_nodes)
         return nodes
@@ -1096,7 +1279,7 @@ class NodeEditorWindow(QMainWindow):
 
     def _select_date_children_if_needed(self) -> bool:
         try:
-            selected_nodes = list(self._graph.selected_nodes())
+            selected_nodes = list(self._graph_selected_nodes())
         except Exception:  # pragma: no cover - NodeGraphQt 依存の例外
             LOGGER.debug("選択中ノードの取得に失敗しました", exc_info=True)
             return False
@@ -1144,6 +1327,12 @@ class NodeEditorWindow(QMainWindow):
         if self._select_date_children_if_needed():
             return
 
+        # ドラッグ中などに同じ選択のまま通知が続く場合は詳細を作り直さない。
+        if not self._node_details_stale:
+            nodes = self._graph_selected_nodes()
+            if (nodes[0] if nodes else None) is self._current_node:
+                return
+
         self._update_selected_node_info()
 
     def _on_port_connection_changed(self, *_ports, **_kwargs) -> None:
@@ -1151,9 +1340,12 @@ class NodeEditorWindow(QMainWindow):
         self._update_selected_node_info()
 
     def _update_selected_node_info(self) -> None:
-        nodes = self._graph.selected_nodes()
+        # 入力途中のメモは切り替え前のノードへ確定させる。
+        self._flush_pending_memo_text()
+        nodes = self._graph_selected_nodes()
         node = nodes[0] if nodes else None
         self._current_node = node
+        self._node_details_stale = False
 
         inspector = self._inspector_dock
         if node is None:
@@ -1168,8 +1360,8 @@ class NodeEditorWindow(QMainWindow):
         node_type = getattr(node, "type_", None)
         if callable(node_type):
             node_type = node_type()
-        if not node_type:
-            node_type = node.__class__.__name__
+        # インスペクタには文字列として渡し、表示側での変換を不要にする。
+        node_type = str(node_type) if node_type else node.__class__.__name__
         position = node.pos() if hasattr(node, "pos") else (0, 0)
         pos_text = (
             f"({int(position[0])}, {int(position[1])})"
@@ -1226,7 +1418,7 @@ class NodeEditorWindow(QMainWindow):
 
         seen_keys: Set[str] = set()
         custom_props = self._node_custom_properties(node)
-        for key in sorted(custom_props):
+        for key in self._ordered_keys(custom_props):
             label = str(key)
             properties.append((label, self._format_property_value(custom_props[key])))
             seen_keys.add(label)
@@ -1254,7 +1446,7 @@ class NodeEditorWindow(QMainWindow):
                 "subgraph_session",
                 "template",
             }
-            for key in sorted(raw_props):
+            for key in self._ordered_keys(raw_props):
                 if key in skip_keys or key == "custom":
                     continue
                 label = str(key)
@@ -1264,6 +1456,17 @@ class NodeEditorWindow(QMainWindow):
 
         return properties
 
+    @staticmethod
+    def _ordered_keys(mapping: Mapping) -> List:
+        """キーを昇順で返す。既に昇順で並んでいれば並べ替えを省く。"""
+
+        keys = list(mapping)
+        for index in range(len(keys) - 1):
+            if keys[index + 1] < keys[index]:
+                keys.sort()
+                break
+        return keys
+
     def _format_property_value(self, value: object) -> str:
         if isinstance(value, (QtCore.QPointF, QtCore.QPoint)):
             try:
@@ -1284,6 +1487,7 @@ class NodeEditorWindow(QMainWindow):
             return "-"
         return str(value)
 
+    @Slot(str)
     def _handle_rename_requested(self, new_name: str) -> None:
         if self._current_node is None:
             self._show_info_dialog("名前を変更するノードを選択してください。")
@@ -1302,23 +1506,33 @@ class NodeEditorWindow(QMainWindow):
         self._set_modified(True)
         self._refresh_node_catalog()
 
+    def _flush_pending_memo_text(self) -> None:
+        if self._inspector_dock is not None:
+            self._inspector_dock.flush_memo_text()
+
+    @Slot(str)
     def _handle_memo_text_changed(self, text: str) -> None:
-        if self._current_node is None or not self._is_memo_node(self._current_node):
+        node = self._current_node
+        if node is None or not self._is_memo_node(node):
             return
-        try:
-            current = self._current_node.get_property("memo_text")
-        except Exception:  # pragma: no cover - NodeGraph 依存の例外
-            LOGGER.debug("メモテキストの取得に失敗しました", exc_info=True)
-            current = None
+        current = self._memo_text_shadow.get(node)
+        if current is None:
+            try:
+                current = node.get_property("memo_text")
+            except Exception:  # pragma: no cover - NodeGraph 依存の例外
+                LOGGER.debug("メモテキストの取得に失敗しました", exc_info=True)
+                current = None
         if current == text:
             return
         try:
-            self._current_node.set_property("memo_text", text)
+            node.set_property("memo_text", text)
         except Exception:  # pragma: no cover - NodeGraph 依存の例外
             LOGGER.debug("メモテキストの更新に失敗しました", exc_info=True)
             return
+        self._memo_text_shadow[node] = text
         self._set_modified(True)
 
+    @Slot(int)
     def _handle_memo_font_size_changed(self, value: int) -> None:
         if self._current_node is None or not self._is_memo_node(self._current_node):
             return
@@ -1336,6 +1550,7 @@ class NodeEditorWindow(QMainWindow):
             return
         self._set_modified(True)
 
+    @Slot()
     def _handle_tool_launch_requested(self) -> None:
         if self._current_node is None or not isinstance(self._current_node, ToolEnvironmentNode):
             self._show_info_dialog("起動するツールノードを選択してください。")
@@ -1384,6 +1599,8 @@ class NodeEditorWindow(QMainWindow):
         self._align_connected_nodes(self._current_node, direction="outputs")
 
     def _handle_nodes_moved(self, node_data) -> None:
+        # 位置や日付ノードの子の表示が変わるため、次の選択通知で詳細を作り直す。
+        self._node_details_stale = True
         node_views = list(node_data.keys()) if isinstance(node_data, Mapping) else []
         snapped = self._apply_snap_to_views(node_views)
         moved_nodes = [self._graph.get_node_by_id(getattr(view, "id", "")) for view in node_views]
@@ -1742,6 +1959,7 @@ class NodeEditorWindow(QMainWindow):
         except Exception:  # pragma: no cover - NodeGraph 依存の例外
             LOGGER.debug("メモテキストの取得に失敗しました", exc_info=True)
             memo_text = ""
+        self._memo_text_shadow[node] = memo_text
         try:
             font_size = node.get_property("memo_font_size")
         except Exception:  # pragma: no cover - NodeGraph 依存の例外
@@ -1889,7 +2107,8 @@ class NodeEditorWindow(QMainWindow):
             target_dir.mkdir(parents=True, exist_ok=True)
             destination = target_dir / source_path.name
             if source_path != destination:
-                shutil.copy2(source_path, destination)
+                # 取り込むアセットは内容だけあればよいため、更新日時などの属性は複製しない。
+                shutil.copyfile(source_path, destination)
         except OSError as exc:
             self._show_error_dialog(f"アセットのコピーに失敗しました: {exc}")
             return
@@ -1900,8 +2119,8 @@ class NodeEditorWindow(QMainWindow):
     def _write_project_to_path(self, path: Path) -> None:
         state = self._export_project_state()
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(state, handle, ensure_ascii=True, indent=2)
+        # 細かな書き込みを繰り返さないよう、文字列へまとめてから一度に書き出す。
+        path.write_text(json.dumps(state, ensure_ascii=True, indent=2), encoding="utf-8")
 
     def _sync_rez_packages_to_project(self) -> None:
         if self._current_project_root is None:
@@ -1937,17 +2156,17 @@ class NodeEditorWindow(QMainWindow):
                 LOGGER.warning("グラフ初期化中のノード削除に失敗しました", exc_info=True)
             self._remove_node_metadata(existing_nodes)
         self._known_nodes.clear()
+        self._invalidate_all_nodes_cache()
         self._node_metadata.clear()
+        self._node_by_uuid.clear()
+        self._custom_props_cache.clear()
+        self._type_id_cache.clear()
         self._node_spawn_offset = 0
-        self._task_count = 0
-        self._review_count = 0
-        self._memo_count = 0
-        clear_selection = getattr(self._graph, "clear_selection", None)
-        if callable(clear_selection):
-            try:
-                clear_selection()
-            except Exception:  # pragma: no cover - NodeGraphQt 依存の例外
-                LOGGER.debug("グラフ選択状態のリセットに失敗しました", exc_info=True)
+        self._reset_create_counters()
+        try:
+            self._graph_clear_selection()
+        except Exception:  # pragma: no cover - NodeGraphQt 依存の例外
+            LOGGER.debug("グラフ選択状態のリセットに失敗しました", exc_info=True)
         self._on_selection_changed()
         self._refresh_node_catalog()
 
@@ -1967,8 +2186,7 @@ class NodeEditorWindow(QMainWindow):
             self._set_modified(False)
 
     def _load_project_from_path(self, path: Path) -> bool:
-        with path.open("r", encoding="utf-8") as handle:
-            state = json.load(handle)
+        state = json.loads(path.read_text(encoding="utf-8"))
         return self._apply_project_state(state)
 
     def _collect_rez_packages_in_graph(self) -> List[str]:
@@ -2158,84 +2376,93 @@ class NodeEditorWindow(QMainWindow):
             self._show_warning_dialog(result.message)
 
     def _export_project_state(self) -> Dict:
+        self._flush_pending_memo_text()
         nodes = self._collect_all_nodes()
         return self._build_state_from_nodes(nodes)
 
     def _build_state_from_nodes(self, nodes: Iterable) -> Dict:
-        node_list = list(nodes)
-        node_entries = []
-        node_id_map: Dict = {}
-        node_uuid_map: Dict[object, str] = {}
-        for index, node in enumerate(node_list):
-            node_id_map[node] = index
-            node_uuid, assigned_at, _ = self._ensure_node_metadata(node)
-            node_uuid_map[node] = node_uuid
-            entry = {
-                "id": index,
-                "name": self._safe_node_name(node),
-                "type": self._node_type_identifier(node),
-                "position": self._safe_node_position(node),
-                "uuid": node_uuid,
-            }
-            if assigned_at:
-                entry["uuid_assigned_at"] = assigned_at
-            custom_props = self._node_custom_properties(node)
-            if custom_props:
-                entry["custom_properties"] = custom_props
-            node_entries.append(entry)
-
-        connections = []
-        seen_connections: Set[
-            Tuple[str, Optional[int], str, str, Optional[int], str]
-        ] = set()
-        for node in node_list:
-            for port in self._collect_ports(node, output=True):
-                for connected in self._connected_ports(port):
-                    if not isinstance(connected, Port):
-                        continue
-                    target_node = connected.node() if hasattr(connected, "node") else None
-                    if target_node is None or target_node not in node_id_map:
-                        continue
-                    source_uuid = node_uuid_map.get(node)
-                    target_uuid = node_uuid_map.get(target_node)
-                    if source_uuid is None or target_uuid is None:
-                        continue
-                    source_id = node_id_map[node]
-                    target_id = node_id_map[target_node]
-                    source_name = self._safe_port_name(port)
-                    target_name = self._safe_port_name(connected)
-                    source_index = self._port_index_in_node(node, port, output=True)
-                    target_index = self._port_index_in_node(target_node, connected, output=False)
-                    key = (
-                        source_uuid,
-                        source_index,
-                        source_name,
-                        target_uuid,
-                        target_index,
-                        target_name,
+        # 接続の走査では同じノードのポート一覧を何度も引くため、この間だけ保持する。
+        with self._port_traversal_cache():
+            node_list = list(nodes)
+            node_entries = []
+            # ノードごとの (id, uuid) と出力ポートの (ポート, 番号, 名前) は先に一度だけ求め、
+            # 接続の走査ではこれらを引くだけにする。
+            node_refs: Dict[object, Tuple[int, str]] = {}
+            output_port_meta: List[Tuple[object, List[Tuple[Port, int, str]]]] = []
+            for index, node in enumerate(node_list):
+                node_uuid, assigned_at, _ = self._ensure_node_metadata(node)
+                node_refs[node] = (index, node_uuid)
+                output_port_meta.append(
+                    (
+                        node,
+                        [
+                            (port, port_index, self._safe_port_name(port))
+                            for port_index, port in enumerate(
+                                self._collect_ports(node, output=True)
+                            )
+                        ],
+                    )
+                )
+                entry = {
+                    "id": index,
+                    "name": self._safe_node_name(node),
+                    "type": self._node_type_identifier(node),
+                    "position": self._safe_node_position(node),
+                    "uuid": node_uuid,
+                }
+                if assigned_at:
+                    entry["uuid_assigned_at"] = assigned_at
+                custom_props = self._node_custom_properties(node)
+                if custom_props:
+                    entry["custom_properties"] = custom_props
+                node_entries.append(entry)
+
+            connections = []
+            # 重複判定は出力ポート単位の集合で行い、接続先側の値だけをキーにする。
+            seen_per_source: Dict[Tuple[str, int, str], Set[Tuple[str, Optional[int], str]]] = {}
+            for node, ports_meta in output_port_meta:
+                source_id, source_uuid = node_refs[node]
+                for port, source_index, source_name in ports_meta:
+                    seen_targets = seen_per_source.setdefault(
+                        (source_uuid, source_index, source_name), set()
                     )
-                    if key in seen_connections:
-                        continue
-                    seen_connections.add(key)
-                    entry = {
-                        "source": source_id,
-                        "source_uuid": source_uuid,
-                        "source_port": source_name,
-                        "target": target_id,
-                        "target_uuid": target_uuid,
-                        "target_port": target_name,
-                    }
-                    if source_index is not None:
-                        entry["source_port_index"] = source_index
-                    if target_index is not None:
-                        entry["target_port_index"] = target_index
-                    connections.append(entry)
-
-        return {"nodes": node_entries, "connections": connections}
+                    for connected in self._connected_ports(port):
+                        # 接続先の型は確認せず、出力対象のノードに属するかどうかだけで判定する。
+                        try:
+                            target_node = connected.node()
+                        except AttributeError:
+                            continue
+                        target_ref = node_refs.get(target_node)
+                        if target_ref is None:
+                            continue
+                        target_id, target_uuid = target_ref
+                        target_name = self._safe_port_name(connected)
+                        target_index = self._port_index_in_node(
+                            target_node, connected, output=False
+                        )
+                        key = (target_uuid, target_index, target_name)
+                        if key in seen_targets:
+                            continue
+                        seen_targets.add(key)
+                        # 出力ポートの番号は常に決まっているため、最初の生成時に含めておく。
+                        entry = {
+                            "source": source_id,
+                            "source_uuid": source_uuid,
+                            "source_port": source_name,
+                            "target": target_id,
+                            "target_uuid": target_uuid,
+                            "target_port": target_name,
+                            "source_port_index": source_index,
+                        }
+                        if target_index is not None:
+                            entry["target_port_index"] = target_index
+                        connections.append(entry)
+
+            return {"nodes": node_entries, "connections": connections}
 
     def _file_export_selected_nodes(self) -> None:
-        selected_nodes = getattr(self._graph, "selected_nodes", None)
-        if not callable(selected_nodes):
+        selected_nodes = self._graph_selected_nodes
+        if selected_nodes is None:
             self._show_error_dialog("選択中のノードを取得できませんでした。")
             return
         nodes = list(selected_nodes() or [])
@@ -2281,13 +2508,17 @@ class NodeEditorWindow(QMainWindow):
             self._remove_node_metadata(existing_nodes)
 
         self._known_nodes.clear()
+        self._invalidate_all_nodes_cache()
         self._node_metadata.clear()
+        self._node_by_uuid.clear()
+        self._custom_props_cache.clear()
+        self._type_id_cache.clear()
         self._node_spawn_offset = 0
-        self._task_count = 0
-        self._review_count = 0
+        self._reset_create_counters()
 
         identifier_map: Dict[int, object] = {}
-        uuid_map: Dict[str, object] = {}
+        # 連番の数え直しに使う種別ごとのノード数は、生成と同時に数える。
+        type_counts: Counter = Counter()
         metadata_changed = False
         for entry in nodes_info:
             if not isinstance(entry, dict):
@@ -2309,14 +2540,14 @@ class NodeEditorWindow(QMainWindow):
             if isinstance(entry_id, int):
                 identifier_map[entry_id] = node
             self._known_nodes.append(node)
+            type_counts[self._node_type_identifier(node)] += 1
             node_uuid = entry.get("uuid")
             assigned_at = entry.get("uuid_assigned_at")
-            normalized_uuid, _, changed = self._ensure_node_metadata(
+            _, _, changed = self._ensure_node_metadata(
                 node,
                 uuid_value=node_uuid if isinstance(node_uuid, str) else None,
                 assigned_at=assigned_at if isinstance(assigned_at, str) else None,
             )
-            uuid_map[normalized_uuid] = node
             if changed:
                 metadata_changed = True
             custom_props = entry.get("custom_properties")
@@ -2330,113 +2561,106 @@ class NodeEditorWindow(QMainWindow):
 
         failed_operations: List[str] = []
 
-        for index, connection in enumerate(connections_info):
-            if not isinstance(connection, dict):
-                failed_operations.append(
-                    f"接続エントリ #{index + 1} の形式が不正なため処理できませんでした。"
+        with self._port_traversal_cache():
+            for index, connection in enumerate(connections_info):
+                if not isinstance(connection, dict):
+                    failed_operations.append(
+                        f"接続エントリ #{index + 1} の形式が不正なため処理できませんでした。"
+                    )
+                    continue
+                source_node = None
+                target_node = None
+                source_uuid = connection.get("source_uuid")
+                target_uuid = connection.get("target_uuid")
+                if isinstance(source_uuid, str):
+                    source_node = self._node_by_uuid.get(source_uuid.lower())
+                if isinstance(target_uuid, str):
+                    target_node = self._node_by_uuid.get(target_uuid.lower())
+                if source_node is None:
+                    source_id = connection.get("source")
+                    if isinstance(source_id, int):
+                        source_node = identifier_map.get(source_id)
+                if target_node is None:
+                    target_id = connection.get("target")
+                    if isinstance(target_id, int):
+                        target_node = identifier_map.get(target_id)
+                raw_source_id = connection.get("source")
+                raw_target_id = connection.get("target")
+                if isinstance(source_uuid, str) and source_uuid:
+                    source_label = source_uuid
+                elif isinstance(raw_source_id, int):
+                    source_label = str(raw_source_id)
+                else:
+                    source_label = "不明"
+                if isinstance(target_uuid, str) and target_uuid:
+                    target_label = target_uuid
+                elif isinstance(raw_target_id, int):
+                    target_label = str(raw_target_id)
+                else:
+                    target_label = "不明"
+                if source_node is None or target_node is None:
+                    failed_operations.append(
+                        "接続（source="
+                        + source_label
+                        + ", target="
+                        + target_label
+                        + "）のノードが見つからないため再現できませんでした。"
+                    )
+                    continue
+                source_name, source_index = self._parse_connection_port_reference(
+                    connection.get("source_port"),
+                    connection.get("source_port_index"),
                 )
-                continue
-            source_node = None
-            target_node = None
-            source_uuid = connection.get("source_uuid")
-            target_uuid = connection.get("target_uuid")
-            if isinstance(source_uuid, str):
-                source_node = uuid_map.get(source_uuid)
-            if isinstance(target_uuid, str):
-                target_node = uuid_map.get(target_uuid)
-            if source_node is None:
-                source_id = connection.get("source")
-                if isinstance(source_id, int):
-                    source_node = identifier_map.get(source_id)
-            if target_node is None:
-                target_id = connection.get("target")
-                if isinstance(target_id, int):
-                    target_node = identifier_map.get(target_id)
-            raw_source_id = connection.get("source")
-            raw_target_id = connection.get("target")
-            if isinstance(source_uuid, str) and source_uuid:
-                source_label = source_uuid
-            elif isinstance(raw_source_id, int):
-                source_label = str(raw_source_id)
-            else:
-                source_label = "不明"
-            if isinstance(target_uuid, str) and target_uuid:
-                target_label = target_uuid
-            elif isinstance(raw_target_id, int):
-                target_label = str(raw_target_id)
-            else:
-                target_label = "不明"
-            if source_node is None or target_node is None:
-                failed_operations.append(
-                    "接続（source="
-                    + source_label
-                    + ", target="
-                    + target_label
-                    + "）のノードが見つからないため再現できませんでした。"
+                target_name, target_index = self._parse_connection_port_reference(
+                    connection.get("target_port"),
+                    connection.get("target_port_index"),
                 )
-                continue
-            source_name, source_index = self._parse_connection_port_reference(
-                connection.get("source_port"),
-                connection.get("source_port_index"),
-            )
-            target_name, target_index = self._parse_connection_port_reference(
-                connection.get("target_port"),
-                connection.get("target_port_index"),
-            )
-            source_port = self._find_port(
-                source_node,
-                port_name=source_name,
-                port_index=source_index,
-                output=True,
-            )
-            target_port = self._find_port(
-                target_node,
-                port_name=target_name,
-                port_index=target_index,
-                output=False,
-            )
-            if source_port is None:
-                source_port = self._first_output_port(source_node)
-            if target_port is None:
-                target_port = self._first_input_port(target_node)
-            if source_port is None or target_port is None:
-                missing_parts: List[str] = []
-                if source_port is None:
-                    missing_parts.append("出力ポート")
-                if target_port is None:
-                    missing_parts.append("入力ポート")
-                reason = "と".join(missing_parts)
-                failed_operations.append(
-                    f"接続（source={source_label}, target={target_label}）の{reason}を特定できませんでした。"
-                )
-                continue
-            try:
-                self._connect_ports_compat(source_port, target_port)
-            except Exception as exc:
-                failed_operations.append(
-                    f"接続（source={source_label}, target={target_label}）の再現に失敗しました: {exc}"
+                source_port = self._find_port(
+                    source_node,
+                    port_name=source_name,
+                    port_index=source_index,
+                    output=True,
                 )
-                LOGGER.debug(
-                    "接続情報の復元に失敗しました: source=%s, target=%s",
-                    source_label,
-                    target_label,
-                    exc_info=True,
+                target_port = self._find_port(
+                    target_node,
+                    port_name=target_name,
+                    port_index=target_index,
+                    output=False,
                 )
-                continue
+                if source_port is None:
+                    source_port = self._first_output_port(source_node)
+                if target_port is None:
+                    target_port = self._first_input_port(target_node)
+                if source_port is None or target_port is None:
+                    missing_parts: List[str] = []
+                    if source_port is None:
+                        missing_parts.append("出力ポート")
+                    if target_port is None:
+                        missing_parts.append("入力ポート")
+                    reason = "と".join(missing_parts)
+                    failed_operations.append(
+                        f"接続（source={source_label}, target={target_label}）の{reason}を特定できませんでした。"
+                    )
+                    continue
+                try:
+                    self._connect_ports_compat(source_port, target_port)
+                except Exception as exc:
+                    failed_operations.append(
+                        f"接続（source={source_label}, target={target_label}）の再現に失敗しました: {exc}"
+                    )
+                    LOGGER.debug(
+                        "接続情報の復元に失敗しました: source=%s, target=%s",
+                        source_label,
+                        target_label,
+                        exc_info=True,
+                    )
+                    continue
 
+        self._invalidate_all_nodes_cache()
         self._node_spawn_offset = len(self._known_nodes)
-        self._task_count = sum(
-            1 for node in self._known_nodes if self._node_type_identifier(node) == "sotugyo.demo.TaskNode"
-        )
-        self._review_count = sum(
-            1 for node in self._known_nodes if self._node_type_identifier(node) == "sotugyo.demo.ReviewNode"
-        )
-        self._memo_count = sum(
-            1 for node in self._known_nodes if self._node_type_identifier(node) == MemoNode.node_type_identifier()
-        )
-        clear_selection = getattr(self._graph, "clear_selection", None)
-        if callable(clear_selection):
-            clear_selection()
+        for node_type in self._RECOUNTED_NODE_TYPES:
+            self._create_counters[node_type] = type_counts.get(node_type, 0)
+        self._graph_clear_selection()
         self._on_selection_changed()
         self._refresh_node_catalog()
 
@@ -2490,16 +2714,24 @@ class NodeEditorWindow(QMainWindow):
         return str(value)
 
     def _node_custom_properties(self, node) -> Dict[str, object]:
-        props = self._node_custom_properties_map(node)
-        if not isinstance(props, dict):
-            return {}
-        serializable: Dict[str, object] = {}
-        for key, value in props.items():
-            if isinstance(key, str):
-                serializable[key] = self._normalize_custom_property_value(value)
-        return serializable
+        cached = self._custom_props_cache.get(node)
+        if cached is None:
+            props = self._node_custom_properties_map(node)
+            if not isinstance(props, dict):
+                return {}
+            cached = {
+                key: self._normalize_custom_property_value(value)
+                for key, value in props.items()
+                if isinstance(key, str)
+            }
+            self._custom_props_cache[node] = cached
+        # 保持している辞書を呼び出し側で書き換えられないよう複製して返す。
+        return dict(cached)
 
     def _set_node_custom_property(self, node, key: str, value: object) -> bool:
+        # モデルの辞書を直接書き換える経路は property_changed が通知されないため、
+        # ここで保存用の控えを破棄する。
+        self._custom_props_cache.pop(node, None)
         props = self._node_custom_properties_map(node)
         if isinstance(props, dict):
             props[key] = value
@@ -2515,6 +2747,17 @@ class NodeEditorWindow(QMainWindow):
         return False
 
     def _node_type_identifier(self, node) -> str:
+        cached = self._type_id_cache.get(node)
+        if cached is not None:
+            return cached
+        identifier = self._resolve_node_type_identifier(node)
+        try:
+            self._type_id_cache[node] = identifier
+        except TypeError:  # pragma: no cover - 弱参照を作れないオブジェクト
+            pass
+        return identifier
+
+    def _resolve_node_type_identifier(self, node) -> str:
         type_getter = getattr(node, "type_", None)
         if callable(type_getter):
             try:
@@ -2559,7 +2802,32 @@ class NodeEditorWindow(QMainWindow):
             LOGGER.debug("接続ポートの取得に失敗しました: %r", port, exc_info=True)
             return []
 
+    @contextmanager
+    def _port_traversal_cache(self):
+        """接続の出力・復元の間だけ、ノードごとのポート一覧を保持する。"""
+
+        if self._port_cache is not None:
+            yield
+            return
+        self._port_cache = {}
+        self._port_index_cache = {}
+        try:
+            yield
+        finally:
+            self._port_cache = None
+            self._port_index_cache = None
+
     def _collect_ports(self, node, *, output: bool) -> List[Port]:
+        cache = self._port_cache
+        if cache is None:
+            return self._query_ports(node, output=output)
+        key = (id(node), output)
+        ports = cache.get(key)
+        if ports is None:
+            ports = cache[key] = self._query_ports(node, output=output)
+        return ports
+
+    def _query_ports(self, node, *, output: bool) -> List[Port]:
         accessor = "output_ports" if output else "input_ports"
         ports_getter = getattr(node, accessor, None)
         if not callable(ports_getter):
@@ -2588,11 +2856,22 @@ class NodeEditorWindow(QMainWindow):
                 ports.append(entry)
         return ports
 
-    def _port_index_in_node(self, node, port, *, output: bool) -> Optional[int]:
+    def _port_index_map(self, node, *, output: bool) -> Dict[int, int]:
+        cache = self._port_index_cache
+        key = (id(node), output)
+        if cache is not None:
+            index_map = cache.get(key)
+            if index_map is not None:
+                return index_map
+        index_map = {}
         for index, candidate in enumerate(self._collect_ports(node, output=output)):
-            if candidate is port:
-                return index
-        return None
+            index_map.setdefault(id(candidate), index)
+        if cache is not None:
+            cache[key] = index_map
+        return index_map
+
+    def _port_index_in_node(self, node, port, *, output: bool) -> Optional[int]:
+        return self._port_index_map(node, output=output).get(id(port))
 
     @staticmethod
     def _parse_connection_port_reference(
@@ -2697,6 +2976,8 @@ class NodeEditorWindow(QMainWindow):
                 LOGGER.debug("スタート画面の更新通知に失敗しました", exc_info=True)
 
     def _confirm_discard_changes(self, message: Optional[str] = None) -> bool:
+        # 送信待ちのメモ入力も変更として扱えるよう、判定の前に確定させる。
+        self._flush_pending_memo_text()
         if not self._is_modified:
             return True
         text = (
@@ -2734,6 +3015,7 @@ class NodeEditorWindow(QMainWindow):
         return result == QMessageBox.StandardButton.Yes
 
     def closeEvent(self, event: QCloseEvent) -> None:
+        self._flush_pending_memo_text()
         if not self._confirm_discard_changes("未保存の変更があります。ウィンドウを閉じますか？"):
             event.ignore()
             return
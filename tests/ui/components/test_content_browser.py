@@ -0,0 +1,64 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+QtWidgets = pytest.importorskip("qtpy.QtWidgets")
+
+from sotugyo.infrastructure.settings import InMemorySettingsStore
+from sotugyo.ui.components import content_browser
+from sotugyo.ui.components.content_browser import NodeCatalogEntry, NodeContentBrowser
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(
+        content_browser,
+        "create_settings_store",
+        lambda *args, **kwargs: InMemorySettingsStore(),
+    )
+    widget = NodeContentBrowser()
+    yield widget
+    widget.deleteLater()
+    app.processEvents()
+
+
+def _entries():
+    return (
+        NodeCatalogEntry("sotugyo.memo.MemoNode", "メモ", "", "メモ"),
+        NodeCatalogEntry("sotugyo.tool.ToolNode", "ツール", "", "ツール環境"),
+    )
+
+
+def test_set_catalog_entries_restores_deleted_entry_on_same_catalog(browser):
+    entries = _entries()
+    browser.set_catalog_entries(entries)
+    target = browser._entry_items_by_type()["sotugyo.memo.MemoNode"]
+    parent = next(
+        item.folder
+        for item in browser._root_folder.iter_items()
+        if item.folder is not None and target in item.folder.items
+    )
+    browser._current_folder = parent
+
+    browser._delete_items([target])
+    assert "sotugyo.memo.MemoNode" not in browser._entry_items_by_type()
+
+    browser.set_catalog_entries(entries)
+
+    assert "sotugyo.memo.MemoNode" in browser._entry_items_by_type()
+
+
+def test_set_catalog_entries_skips_sync_when_nothing_changed(browser, monkeypatch):
+    entries = _entries()
+    browser.set_catalog_entries(entries)
+    calls = []
+    monkeypatch.setattr(
+        browser, "_sync_catalog_entries", lambda values: calls.append(values)
+    )
+
+    browser.set_catalog_entries(entries)
+
+    assert calls == []
@@ -0,0 +1,132 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+QtWidgets = pytest.importorskip("qtpy.QtWidgets")
+
+from sotugyo.ui.windows.docks.inspector import NodeInspectorPanel, _PropertyModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _record_model_signals(model):
+    events = []
+    model.rowsInserted.connect(
+        lambda parent, first, last: events.append(("inserted", first, last))
+    )
+    model.rowsRemoved.connect(
+        lambda parent, first, last: events.append(("removed", first, last))
+    )
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=(): events.append(
+            ("changed", top_left.row(), bottom_right.row())
+        )
+    )
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    return events
+
+
+def _rows(model):
+    return [
+        (model.data(model.index(row, 0)), model.data(model.index(row, 1)))
+        for row in range(model.rowCount())
+    ]
+
+
+def test_property_model_set_rows_inserts_added_rows(app):
+    model = _PropertyModel()
+    model.set_rows((("a", "1"),))
+    events = _record_model_signals(model)
+
+    assert model.set_rows((("a", "2"), ("b", "3"), ("c", "4")))
+
+    assert events == [("inserted", 1, 2), ("changed", 0, 0)]
+    assert _rows(model) == [("a", "2"), ("b", "3"), ("c", "4")]
+
+
+def test_property_model_set_rows_removes_surplus_rows(app):
+    model = _PropertyModel()
+    model.set_rows((("a", "1"), ("b", "2"), ("c", "3")))
+    events = _record_model_signals(model)
+
+    assert model.set_rows((("x", "9"),))
+
+    assert events == [("removed", 1, 2), ("changed", 0, 0)]
+    assert _rows(model) == [("x", "9")]
+
+
+def test_property_model_set_rows_updates_rows_in_place(app):
+    model = _PropertyModel()
+    model.set_rows((("a", "1"), ("b", "2")))
+    events = _record_model_signals(model)
+
+    assert model.set_rows((("a", "1"), ("b", "5")))
+
+    assert events == [("changed", 0, 1)]
+    assert _rows(model) == [("a", "1"), ("b", "5")]
+
+
+def test_property_model_set_rows_ignores_identical_rows(app):
+    model = _PropertyModel()
+    model.set_rows((("a", "1"),))
+    events = _record_model_signals(model)
+
+    assert not model.set_rows((("a", "1"),))
+
+    assert events == []
+
+
+@pytest.fixture
+def panel(app):
+    widget = NodeInspectorPanel()
+    # メモ編集欄は「ノード操作」タブの表示時に生成されるため、先に表示しておく。
+    widget._tabs.setCurrentIndex(2)
+    yield widget
+    widget.deleteLater()
+    app.processEvents()
+
+
+def _type_memo(panel, text):
+    emitted = []
+    panel.memo_text_changed.connect(emitted.append)
+    panel._memo_text_edit.setPlainText(text)
+    assert panel._memo_emit_timer.isActive()
+    assert emitted == []
+    return emitted
+
+
+def test_show_memo_flushes_pending_memo_text(panel):
+    panel.show_memo("before", 12)
+    emitted = _type_memo(panel, "typed")
+
+    panel.show_memo("other", 12)
+
+    assert emitted == ["typed"]
+    assert not panel._memo_emit_timer.isActive()
+    assert panel._memo_text_edit.toPlainText() == "other"
+
+
+def test_clear_memo_flushes_pending_memo_text(panel):
+    panel.show_memo("before", 12)
+    emitted = _type_memo(panel, "typed")
+
+    panel.clear_memo()
+
+    assert emitted == ["typed"]
+    assert panel._memo_text_edit.toPlainText() == ""
+
+
+def test_flush_memo_text_emits_only_when_pending(panel):
+    panel.show_memo("before", 12)
+    emitted = _type_memo(panel, "typed")
+
+    panel.flush_memo_text()
+    panel.flush_memo_text()
+
+    assert emitted == ["typed"]
+    assert not panel._memo_emit_timer.isActive()